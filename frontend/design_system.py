@@ -3,44 +3,15 @@ IATRO Design System
 Palantir-inspired component library with coherent design patterns
 """
 
+import tkinter as tk
 import customtkinter as ctk
+from functools import lru_cache
+from itertools import islice
+from types import MappingProxyType
 from typing import Optional, Callable, List, Tuple
 
 
 # ==================== Color Palette ====================
-# Centralized color dictionary matching main.py design
-COLORS = {
-    # Background layers
-    "bg_primary": "#0d1117",      # Main app background
-    "bg_medium": "#161b22",       # Cards, panels
-    "bg_light": "#21262d",        # Subtle sections
-    "bg_hover": "#30363d",        # Interactive hover state
-    
-    # Text hierarchy
-    "text_primary": "#f0f6fc",    # Main text (brightest white)
-    "text_secondary": "#c9d1d9",  # Secondary text
-    "text_muted": "#8b949e",      # Tertiary/muted text
-    "text_dim": "#6e7681",        # Disabled/dim text
-    
-    # Accent colors
-    "accent": "#58a6ff",          # Main accent (blue)
-    "accent_hover": "#79c0ff",    # Hover state
-    "selected": "#1f6feb",        # Selected/active
-    "selected_subtle": "#0d47a1", # Subtle background
-    
-    # Status colors
-    "success": "#3fb950",         # Success/positive
-    "warning": "#d29922",         # Warning
-    "danger": "#f85149",          # Error/danger
-    "info": "#58a6ff",            # Information
-    
-    # Structural
-    "border": "#30363d",          # Borders
-    "divider": "#21262d",         # Dividers
-    "card_bg": "#21262d",         # Card background
-}
-
-
 class Colors:
     """Centralized color management - Palantir-inspired dark theme"""
     
@@ -74,71 +45,97 @@ class Colors:
     SHADOW = "#000000"          # Shadow base
 
 
+# Legacy snake_case view of the palette, derived from Colors so the two can't drift.
+# New code should read Colors.* attributes directly.
+COLORS = {
+    "bg_primary": Colors.BG_PRIMARY,
+    "bg_medium": Colors.BG_SECONDARY,
+    "bg_light": Colors.BG_TERTIARY,
+    "bg_hover": Colors.BG_HOVER,
+    "text_primary": Colors.TEXT_PRIMARY,
+    "text_secondary": Colors.TEXT_SECONDARY,
+    "text_muted": Colors.TEXT_TERTIARY,
+    "text_dim": Colors.TEXT_DISABLED,
+    "accent": Colors.ACCENT_PRIMARY,
+    "accent_hover": Colors.ACCENT_HOVER,
+    "selected": Colors.ACCENT_ACTIVE,
+    "selected_subtle": Colors.ACCENT_SUBTLE,
+    "success": Colors.SUCCESS,
+    "warning": Colors.WARNING,
+    "danger": Colors.DANGER,
+    "info": Colors.INFO,
+    "border": Colors.BORDER,
+    "divider": Colors.DIVIDER,
+    "card_bg": Colors.BG_TERTIARY,
+}
+
+
 # ==================== Typography ====================
-class Typography:
+@lru_cache(maxsize=None)
+def _font(family=None, size=None, weight="normal"):
+    """Create each distinct font once - needs a Tk root, so only call after the app exists.
+    family=None keeps CustomTkinter's theme font, as a bare ctk.CTkFont(size=...) would."""
+    return ctk.CTkFont(family=family, size=size, weight=weight)
+
+
+class _Typography:
     """Font system with hierarchy - lazy loaded to avoid early font initialization"""
     
-    _fonts = {}
-    
-    @classmethod
-    def _get_font(cls, family, size, weight):
-        """Lazily create and cache fonts"""
-        key = (family, size, weight)
-        if key not in cls._fonts:
-            cls._fonts[key] = ctk.CTkFont(family=family, size=size, weight=weight)
-        return cls._fonts[key]
-    
     @property
     def DISPLAY_LARGE(self):
-        return self._get_font("Helvetica", 28, "normal")
+        return _font("Helvetica", 28, "normal")
     
     @property
     def DISPLAY_MEDIUM(self):
-        return self._get_font("Helvetica", 22, "normal")
+        return _font("Helvetica", 22, "normal")
     
     @property
     def HEADING_1(self):
-        return self._get_font("Helvetica", 18, "normal")
+        return _font("Helvetica", 18, "normal")
     
     @property
     def HEADING_2(self):
-        return self._get_font("Helvetica", 15, "normal")
+        return _font("Helvetica", 15, "normal")
     
     @property
     def HEADING_3(self):
-        return self._get_font("Helvetica", 13, "normal")
+        return _font("Helvetica", 13, "normal")
     
     @property
     def BODY_LARGE(self):
-        return self._get_font("Helvetica", 12, "normal")
+        return _font("Helvetica", 12, "normal")
     
     @property
     def BODY_MEDIUM(self):
-        return self._get_font("Helvetica", 11, "normal")
+        return _font("Helvetica", 11, "normal")
     
     @property
     def BODY_SMALL(self):
-        return self._get_font("Helvetica", 10, "normal")
+        return _font("Helvetica", 10, "normal")
     
     @property
     def LABEL_LARGE(self):
-        return self._get_font("Helvetica", 11, "normal")
+        return _font("Helvetica", 11, "normal")
     
     @property
     def LABEL_MEDIUM(self):
-        return self._get_font("Helvetica", 10, "normal")
+        return _font("Helvetica", 10, "normal")
     
     @property
     def LABEL_SMALL(self):
-        return self._get_font("Helvetica", 9, "normal")
+        return _font("Helvetica", 9, "normal")
     
     @property
     def MONO_MEDIUM(self):
-        return self._get_font("Courier", 11, "normal")
+        return _font("Courier", 11, "normal")
     
     @property
     def MONO_SMALL(self):
-        return self._get_font("Courier", 10, "normal")
+        return _font("Courier", 10, "normal")
+
+
+# Stateless, so a single shared instance is exported; read fonts as Typography.BODY_LARGE
+Typography = _Typography()
 
 
 # ==================== Spacing System ====================
@@ -194,6 +191,74 @@ class Card(BaseFrame):
         self.configure(border_width=1, border_color=Colors.BORDER)
 
 
+# Button presets, built once. Fonts are stored by Typography name and resolved
+# per button because a CTkFont can only be created once the Tk root exists.
+_BUTTON_SIZES = {
+    "sm": {"height": 28, "font": "LABEL_SMALL"},
+    "md": {"height": 36, "font": "LABEL_LARGE"},
+    "lg": {"height": 44, "font": "BODY_LARGE"},
+}
+
+_BUTTON_VARIANTS = {
+    "primary": {
+        "fg_color": Colors.ACCENT_PRIMARY,
+        "hover_color": Colors.ACCENT_HOVER,
+        "text_color": Colors.TEXT_PRIMARY,
+        "border_width": 0,
+    },
+    "secondary": {
+        "fg_color": Colors.BG_TERTIARY,
+        "hover_color": Colors.BG_HOVER,
+        "text_color": Colors.TEXT_PRIMARY,
+        "border_width": 1,
+        "border_color": Colors.BORDER,
+    },
+    "white": {
+        "fg_color": "#ffffff",
+        "hover_color": "#f5f5f5",
+        "text_color": "#000000",
+        "border_width": 0,
+    },
+    "grey": {
+        "fg_color": Colors.BG_TERTIARY,
+        "hover_color": Colors.BG_HOVER,
+        "text_color": Colors.TEXT_PRIMARY,
+        "border_width": 0,
+    },
+    "success": {
+        "fg_color": Colors.SUCCESS,
+        "hover_color": "#4ac960",
+        "text_color": Colors.TEXT_PRIMARY,
+        "border_width": 0,
+    },
+    "danger": {
+        "fg_color": Colors.DANGER,
+        "hover_color": "#f97a6c",
+        "text_color": Colors.TEXT_PRIMARY,
+        "border_width": 0,
+    },
+    "ghost": {
+        "fg_color": "transparent",
+        "hover_color": Colors.BG_HOVER,
+        "text_color": Colors.ACCENT_PRIMARY,
+        "border_width": 1,
+        "border_color": Colors.ACCENT_PRIMARY,
+    },
+}
+
+# Fixed kwargs for every (variant, size) pair, merged once; the font is left to Button
+_BUTTON_PRESETS = {
+    (variant, size): MappingProxyType({
+        "height": size_config["height"],
+        "corner_radius": Radius.SM,
+        "cursor": "hand2",
+        **variant_config,
+    })
+    for variant, variant_config in _BUTTON_VARIANTS.items()
+    for size, size_config in _BUTTON_SIZES.items()
+}
+
+
 class Button(ctk.CTkButton):
     """Unified button component with sharp edges and smooth animations"""
     
@@ -205,81 +270,48 @@ class Button(ctk.CTkButton):
             size: "sm", "md", "lg"
         """
         
-        # Size mappings
-        sizes = {
-            "sm": {"height": 28, "font": Typography().LABEL_SMALL},
-            "md": {"height": 36, "font": Typography().LABEL_LARGE},
-            "lg": {"height": 44, "font": Typography().BODY_LARGE},
-        }
-        size_config = sizes.get(size, sizes["md"])
-        
-        # Variant mappings
-        variants = {
-            "primary": {
-                "fg_color": Colors.ACCENT_PRIMARY,
-                "hover_color": Colors.ACCENT_HOVER,
-                "text_color": Colors.TEXT_PRIMARY,
-                "border_width": 0,
-            },
-            "secondary": {
-                "fg_color": Colors.BG_TERTIARY,
-                "hover_color": Colors.BG_HOVER,
-                "text_color": Colors.TEXT_PRIMARY,
-                "border_width": 1,
-                "border_color": Colors.BORDER,
-            },
-            "white": {
-                "fg_color": "#ffffff",
-                "hover_color": "#f5f5f5",
-                "text_color": "#000000",
-                "border_width": 0,
-            },
-            "grey": {
-                "fg_color": Colors.BG_TERTIARY,
-                "hover_color": Colors.BG_HOVER,
-                "text_color": Colors.TEXT_PRIMARY,
-                "border_width": 0,
-            },
-            "success": {
-                "fg_color": Colors.SUCCESS,
-                "hover_color": "#4ac960",
-                "text_color": Colors.TEXT_PRIMARY,
-                "border_width": 0,
-            },
-            "danger": {
-                "fg_color": Colors.DANGER,
-                "hover_color": "#f97a6c",
-                "text_color": Colors.TEXT_PRIMARY,
-                "border_width": 0,
-            },
-            "ghost": {
-                "fg_color": "transparent",
-                "hover_color": Colors.BG_HOVER,
-                "text_color": Colors.ACCENT_PRIMARY,
-                "border_width": 1,
-                "border_color": Colors.ACCENT_PRIMARY,
-            },
-        }
-        variant_config = variants.get(variant, variants["primary"])
+        if variant not in _BUTTON_VARIANTS:
+            variant = "primary"
+        if size not in _BUTTON_SIZES:
+            size = "md"
         
-        # Handle width - if not specified, let CTkButton auto-size
         init_kwargs = {
             "text": text,
-            "font": size_config["font"],
-            "height": size_config["height"],
-            "corner_radius": Radius.SM,
-            "cursor": "hand2",
+            "font": getattr(Typography, _BUTTON_SIZES[size]["font"]),
+            **_BUTTON_PRESETS[(variant, size)],
         }
         
+        # Handle width - if not specified, let CTkButton auto-size
         if width is not None:
             init_kwargs["width"] = width
         
-        init_kwargs.update(variant_config)
         init_kwargs.update(kwargs)
         
         super().__init__(parent, **init_kwargs)
 
 
+class _LabelFonts(dict):
+    """Label variant -> Typography font name; unknown variants fall back to body text"""
+    
+    def __missing__(self, variant):
+        return "BODY_MEDIUM"
+
+
+_LABEL_FONTS = _LabelFonts({
+    "display_large": "DISPLAY_LARGE",
+    "display_medium": "DISPLAY_MEDIUM",
+    "heading_1": "HEADING_1",
+    "heading_2": "HEADING_2",
+    "heading_3": "HEADING_3",
+    "body_large": "BODY_LARGE",
+    "body_medium": "BODY_MEDIUM",
+    "body_small": "BODY_SMALL",
+    "label_large": "LABEL_LARGE",
+    "label_medium": "LABEL_MEDIUM",
+    "label_small": "LABEL_SMALL",
+})
+
+
 class Label(ctk.CTkLabel):
     """Unified label component with design system fonts"""
     
@@ -291,22 +323,11 @@ class Label(ctk.CTkLabel):
                     "label_small"
         """
         
-        typo = Typography()
-        font_map = {
-            "display_large": typo.DISPLAY_LARGE,
-            "display_medium": typo.DISPLAY_MEDIUM,
-            "heading_1": typo.HEADING_1,
-            "heading_2": typo.HEADING_2,
-            "heading_3": typo.HEADING_3,
-            "body_large": typo.BODY_LARGE,
-            "body_medium": typo.BODY_MEDIUM,
-            "body_small": typo.BODY_SMALL,
-            "label_large": typo.LABEL_LARGE,
-            "label_medium": typo.LABEL_MEDIUM,
-            "label_small": typo.LABEL_SMALL,
-        }
-        
-        font = font_map.get(variant, Typography.BODY_MEDIUM)
+        # The default variant is by far the most common, so skip the table for it
+        if variant == "body_medium":
+            font = Typography.BODY_MEDIUM
+        else:
+            font = getattr(Typography, _LABEL_FONTS[variant])
         text_color = kwargs.pop("text_color", Colors.TEXT_PRIMARY)
         
         super().__init__(
@@ -326,10 +347,13 @@ class SectionHeader(BaseFrame):
         super().__init__(parent, bg_color="transparent", corner_radius=0, **kwargs)
         
         self.pack(fill="x", pady=(Spacing.LG, Spacing.MD))
+        # Title column takes the slack so the action button sits at the right edge
+        self.grid_columnconfigure(0, weight=1)
         
         # Title
-        title_label = Label(self, text=title, variant="heading_2", text_color=Colors.TEXT_PRIMARY)
-        title_label.pack(side="left", padx=(Spacing.LG, Spacing.MD))
+        if title:
+            title_label = Label(self, text=title, variant="heading_2", text_color=Colors.TEXT_PRIMARY)
+            title_label.grid(row=0, column=0, sticky="w", padx=(Spacing.LG, Spacing.MD))
         
         # Action button if provided
         self.action_btn = None
@@ -341,7 +365,16 @@ class SectionHeader(BaseFrame):
                 size="sm",
                 command=action_command
             )
-            self.action_btn.pack(side="right", padx=Spacing.LG)
+            self.action_btn.grid(row=0, column=1, sticky="e", padx=Spacing.LG)
+
+
+# StatCard status -> value color
+_STAT_CARD_COLORS = {
+    "neutral": Colors.TEXT_PRIMARY,
+    "success": Colors.SUCCESS,
+    "warning": Colors.WARNING,
+    "danger": Colors.DANGER,
+}
 
 
 class StatCard(Card):
@@ -357,14 +390,7 @@ class StatCard(Card):
         """
         super().__init__(parent, **kwargs)
         
-        # Status colors
-        status_colors = {
-            "neutral": Colors.TEXT_PRIMARY,
-            "success": Colors.SUCCESS,
-            "warning": Colors.WARNING,
-            "danger": Colors.DANGER,
-        }
-        color = status_colors.get(status, Colors.TEXT_PRIMARY)
+        color = _STAT_CARD_COLORS.get(status, _STAT_CARD_COLORS["neutral"])
         
         # Icon/label
         if icon_text:
@@ -373,13 +399,15 @@ class StatCard(Card):
             icon_label.pack(anchor="w", padx=Spacing.MD, pady=(Spacing.MD, Spacing.SM))
         
         # Value (large and prominent)
-        value_label = Label(self, text=value, variant="heading_1", text_color=color)
-        value_label.pack(anchor="w", padx=Spacing.MD, pady=Spacing.SM)
+        if value:
+            value_label = Label(self, text=value, variant="heading_1", text_color=color)
+            value_label.pack(anchor="w", padx=Spacing.MD, pady=Spacing.SM)
         
         # Description
-        label_widget = Label(self, text=label, variant="body_small", 
-                           text_color=Colors.TEXT_TERTIARY)
-        label_widget.pack(anchor="w", padx=Spacing.MD, pady=(Spacing.SM, Spacing.MD))
+        if label:
+            label_widget = Label(self, text=label, variant="body_small", 
+                               text_color=Colors.TEXT_TERTIARY)
+            label_widget.pack(anchor="w", padx=Spacing.MD, pady=(Spacing.SM, Spacing.MD))
 
 
 class ProgressBar(ctk.CTkProgressBar):
@@ -423,6 +451,15 @@ class Divider(BaseFrame):
         self.pack(fill="x", pady=Spacing.MD)
 
 
+# Badge status -> (background, text) colors
+_BADGE_COLORS = {
+    "neutral": (Colors.BG_TERTIARY, Colors.TEXT_SECONDARY),
+    "success": ("#1f4620", Colors.SUCCESS),
+    "warning": ("#4a3700", Colors.WARNING),
+    "danger": ("#5a1f1f", Colors.DANGER),
+    "info": ("#0d47a1", Colors.ACCENT_PRIMARY),
+}
+
 class Badge(BaseFrame):
     """Small badge for status/tags"""
     
@@ -431,26 +468,11 @@ class Badge(BaseFrame):
         Args:
             status: "neutral", "success", "warning", "danger", "info"
         """
-        
-        bg_colors = {
-            "neutral": Colors.BG_TERTIARY,
-            "success": "#1f4620",
-            "warning": "#4a3700",
-            "danger": "#5a1f1f",
-            "info": "#0d47a1",
-        }
-        
-        text_colors = {
-            "neutral": Colors.TEXT_SECONDARY,
-            "success": Colors.SUCCESS,
-            "warning": Colors.WARNING,
-            "danger": Colors.DANGER,
-            "info": Colors.ACCENT_PRIMARY,
-        }
+        bg_color, text_color = _BADGE_COLORS.get(status, _BADGE_COLORS["neutral"])
         
         super().__init__(
             parent,
-            bg_color=bg_colors.get(status, Colors.BG_TERTIARY),
+            bg_color=bg_color,
             corner_radius=Radius.SM,
             **kwargs
         )
@@ -459,7 +481,7 @@ class Badge(BaseFrame):
             self,
             text=text,
             variant="label_small",
-            text_color=text_colors.get(status, Colors.TEXT_SECONDARY)
+            text_color=text_color
         )
         label.pack(padx=Spacing.SM, pady=Spacing.XS)
 
@@ -477,21 +499,23 @@ class RankedListItem(Card):
         # Header: rank + title + value
         header = BaseFrame(self, bg_color="transparent", corner_radius=0)
         header.pack(fill="x", padx=Spacing.MD, pady=(Spacing.MD, Spacing.SM))
+        header.grid_columnconfigure(1, weight=1)
         
         # Rank badge
         rank_badge = Badge(header, text=f"#{rank}", status="info")
-        rank_badge.pack(side="left", padx=(0, Spacing.MD))
+        rank_badge.grid(row=0, column=0, padx=(0, Spacing.MD))
         
         # Title
-        title_label = Label(header, text=title, variant="body_large", 
-                          text_color=Colors.TEXT_PRIMARY)
-        title_label.pack(side="left", padx=(0, Spacing.MD))
+        if title:
+            title_label = Label(header, text=title, variant="body_large", 
+                              text_color=Colors.TEXT_PRIMARY)
+            title_label.grid(row=0, column=1, sticky="w", padx=(0, Spacing.MD))
         
         # Value (right aligned)
         if value:
             value_label = Label(header, text=value, variant="label_large", 
                               text_color=value_color)
-            value_label.pack(side="right")
+            value_label.grid(row=0, column=2, sticky="e")
         
         # Subtitle if provided
         if subtitle:
@@ -567,50 +591,61 @@ class OptionButton(ctk.CTkButton):
 
 
 class ConfirmationDialog(ctk.CTkToplevel):
-    """Standard confirmation dialog"""
+    """Standard confirmation dialog - contents are built on the first show()"""
     
     def __init__(self, parent, title: str = "Confirm", 
                  message: str = "", callback: Callable = None,
                  button_text: str = "Confirm", button_variant: str = "primary"):
         super().__init__(parent)
+        # Stay hidden until show(), so a dialog that is never shown never builds its widgets
+        self.withdraw()
         self.title(title)
         self.geometry("400x200")
         self.configure(fg_color=Colors.BG_PRIMARY)
         
         self.result = False
         self.callback = callback
-        
+        self._message = message
+        self._button_text = button_text
+        self._button_variant = button_variant
+        self._built = False
+    
+    def show(self):
+        """Build the dialog contents on first use and display it"""
+        if not self._built:
+            self._build()
+            self._built = True
+        self.deiconify()
+    
+    def _build(self):
         # Message
         msg_label = Label(
             self,
-            text=message,
+            text=self._message,
             variant="body_large",
             text_color=Colors.TEXT_PRIMARY,
             wraplength=350
         )
         msg_label.pack(pady=(Spacing.XL, Spacing.LG), padx=Spacing.LG)
         
-        # Buttons frame
-        btn_frame = BaseFrame(self, bg_color="transparent", corner_radius=0)
-        btn_frame.pack(fill="x", padx=Spacing.LG, pady=Spacing.LG)
-        
-        # Cancel button
+        # Buttons go straight into the dialog, left-packed under the message; anchor="n"
+        # keeps them directly below it rather than centred in the leftover height
         cancel_btn = Button(
-            btn_frame,
+            self,
             text="Cancel",
             variant="secondary",
             command=self.cancel
         )
-        cancel_btn.pack(side="left", padx=(0, Spacing.MD))
+        cancel_btn.pack(side="left", anchor="n", padx=(Spacing.LG, Spacing.MD), pady=Spacing.LG)
         
         # Confirm button
         confirm_btn = Button(
-            btn_frame,
-            text=button_text,
-            variant=button_variant,
+            self,
+            text=self._button_text,
+            variant=self._button_variant,
             command=self.confirm
         )
-        confirm_btn.pack(side="left")
+        confirm_btn.pack(side="left", anchor="n", pady=Spacing.LG)
     
     def confirm(self):
         self.result = True
@@ -635,19 +670,32 @@ class EmptyState(BaseFrame):
         self.pack(fill="both", expand=True)
         
         # Icon
-        icon_label = Label(self, text=icon_text, variant="display_large",
-                         text_color=Colors.TEXT_TERTIARY)
-        icon_label.pack(pady=(Spacing.XXL, Spacing.LG))
+        if icon_text:
+            icon_label = Label(self, text=icon_text, variant="display_large",
+                             text_color=Colors.TEXT_TERTIARY)
+            icon_label.pack(pady=(Spacing.XXL, Spacing.LG))
         
         # Title
-        title_label = Label(self, text=title, variant="heading_2",
-                          text_color=Colors.TEXT_PRIMARY)
-        title_label.pack(pady=Spacing.SM)
+        if title:
+            title_label = Label(self, text=title, variant="heading_2",
+                              text_color=Colors.TEXT_PRIMARY)
+            title_label.pack(pady=Spacing.SM)
         
         # Message
-        msg_label = Label(self, text=message, variant="body_small",
-                        text_color=Colors.TEXT_TERTIARY, wraplength=400)
-        msg_label.pack(pady=Spacing.MD)
+        if message:
+            msg_label = Label(self, text=message, variant="body_small",
+                            text_color=Colors.TEXT_TERTIARY, wraplength=400)
+            msg_label.pack(pady=Spacing.MD)
+
+
+# StatusIndicator status -> dot / label color
+_STATUS_INDICATOR_COLORS = {
+    "neutral": Colors.TEXT_TERTIARY,
+    "success": Colors.SUCCESS,
+    "warning": Colors.WARNING,
+    "danger": Colors.DANGER,
+    "info": Colors.ACCENT_PRIMARY,
+}
 
 
 class StatusIndicator(BaseFrame):
@@ -660,15 +708,7 @@ class StatusIndicator(BaseFrame):
         """
         super().__init__(parent, bg_color="transparent", corner_radius=0, **kwargs)
         
-        status_colors = {
-            "neutral": Colors.TEXT_TERTIARY,
-            "success": Colors.SUCCESS,
-            "warning": Colors.WARNING,
-            "danger": Colors.DANGER,
-            "info": Colors.ACCENT_PRIMARY,
-        }
-        
-        color = status_colors.get(status, Colors.TEXT_TERTIARY)
+        color = _STATUS_INDICATOR_COLORS.get(status, _STATUS_INDICATOR_COLORS["neutral"])
         
         # Dot
         dot = Label(self, text="●", variant="body_small", text_color=color)
@@ -716,16 +756,23 @@ class Grid(BaseFrame):
         self.columns = columns
         self.gap = gap
         self.cell_count = 0
+        # Leading pad is gap for every cell except the first column / first row
+        self._pads = ((0, 0), (gap, 0))
     
-    def add_item(self, widget, **pack_kwargs):
-        """Add item to grid"""
-        row = self.cell_count // self.columns
-        col = self.cell_count % self.columns
+    def add_item(self, widget, **grid_kwargs):
+        """Add item to the next free cell, filling rows left to right"""
+        row, col = divmod(self.cell_count, self.columns)
+        
+        padx = self._pads[col > 0]
+        pady = self._pads[row > 0]
         
-        padx = (self.gap if col > 0 else 0, 0)
-        pady = (self.gap if row > 0 else 0, 0)
+        # Give each row/column its weight the first time a cell lands in it
+        if row == 0:
+            self.grid_columnconfigure(col, weight=1)
+        if col == 0:
+            self.grid_rowconfigure(row, weight=1)
         
-        widget.pack(fill="both", expand=True, padx=padx, pady=pady, **pack_kwargs)
+        widget.grid(row=row, column=col, sticky="nsew", padx=padx, pady=pady, **grid_kwargs)
         self.cell_count += 1
 
 
@@ -736,24 +783,26 @@ class TopBar(ctk.CTkFrame):
     
     def __init__(self, parent, title="IATRO", subtitle="Pediatric Diagnostic Inference System", 
                  on_new_diagnosis=None, **kwargs):
-        super().__init__(parent, fg_color=COLORS["bg_medium"], corner_radius=8, **kwargs)
+        super().__init__(parent, fg_color=Colors.BG_SECONDARY, corner_radius=8, **kwargs)
+        # Subtitle column takes the slack so the button sits at the right edge
+        self.grid_columnconfigure(1, weight=1)
         
         # Title section
         title_label = ctk.CTkLabel(
             self,
             text=title,
-            font=ctk.CTkFont(size=32, weight="bold"),
-            text_color=COLORS["text_primary"]
+            font=_font(size=32, weight="bold"),
+            text_color=Colors.TEXT_PRIMARY
         )
-        title_label.pack(side="left", padx=20, pady=15)
+        title_label.grid(row=0, column=0, padx=20, pady=15)
         
         subtitle_label = ctk.CTkLabel(
             self,
             text=subtitle,
-            font=ctk.CTkFont(size=13),
-            text_color=COLORS["text_secondary"]
+            font=_font(size=13),
+            text_color=Colors.TEXT_SECONDARY
         )
-        subtitle_label.pack(side="left", padx=(0, 20), pady=15)
+        subtitle_label.grid(row=0, column=1, sticky="w", padx=(0, 20), pady=15)
         
         # New diagnosis button
         if on_new_diagnosis:
@@ -761,16 +810,27 @@ class TopBar(ctk.CTkFrame):
                 self,
                 text="New Diagnosis",
                 command=on_new_diagnosis,
-                fg_color=COLORS["bg_light"],
-                hover_color=COLORS["bg_hover"],
-                font=ctk.CTkFont(size=13),
+                fg_color=Colors.BG_TERTIARY,
+                hover_color=Colors.BG_HOVER,
+                font=_font(size=13),
                 width=140,
                 height=32,
-                text_color=COLORS["text_primary"],
+                text_color=Colors.TEXT_PRIMARY,
                 border_width=1,
-                border_color=COLORS["border"]
+                border_color=Colors.BORDER
             )
-            new_btn.pack(side="right", padx=20, pady=15)
+            new_btn.grid(row=0, column=2, sticky="e", padx=20, pady=15)
+
+# Card frame styles keyed by highlight state (selected symptom / top-ranked diagnosis)
+_SYMPTOM_CARD_STYLES = {
+    False: {"fg_color": Colors.BG_SECONDARY, "corner_radius": 6, "border_width": 0, "border_color": None},
+    True: {"fg_color": Colors.BG_HOVER, "corner_radius": 6, "border_width": 1, "border_color": Colors.ACCENT_ACTIVE},
+}
+
+_DIAGNOSIS_CARD_STYLES = {
+    False: {"fg_color": Colors.BG_TERTIARY, "corner_radius": 6, "border_width": 0, "border_color": None},
+    True: {"fg_color": Colors.BG_TERTIARY, "corner_radius": 6, "border_width": 1, "border_color": Colors.ACCENT_ACTIVE},
+}
 
 
 class SymptomCard(ctk.CTkFrame):
@@ -778,157 +838,239 @@ class SymptomCard(ctk.CTkFrame):
     
     def __init__(self, parent, symptom: str, explanation: str, is_selected: bool = False,
                  on_click: Callable = None, on_confirm: Callable = None, **kwargs):
-        super().__init__(
-            parent,
-            fg_color=COLORS["bg_medium"] if not is_selected else COLORS["bg_hover"],
-            corner_radius=6,
-            border_width=1 if is_selected else 0,
-            border_color=COLORS["selected"] if is_selected else None,
-            **kwargs
-        )
+        is_selected = bool(is_selected)
+        super().__init__(parent, **_SYMPTOM_CARD_STYLES[is_selected], **kwargs)
+        self.is_selected = is_selected
+        self.on_confirm = on_confirm
+        self.confirm_frame = None
         
-        # Make frame clickable
-        self.bind("<Button-1>", lambda e: on_click() if on_click else None)
+        # Make frame clickable - one shared handler, and no bindings at all without on_click
+        on_press = (lambda e: on_click()) if on_click else None
+        if on_press:
+            self.bind("<Button-1>", on_press)
         
         # Content frame
         content_frame = ctk.CTkFrame(self, fg_color="transparent")
         content_frame.pack(fill="x", padx=15, pady=12)
-        content_frame.bind("<Button-1>", lambda e: on_click() if on_click else None)
+        if on_press:
+            content_frame.bind("<Button-1>", on_press)
         
         # Symptom name
         name_label = ctk.CTkLabel(
             content_frame,
             text=symptom,
-            font=ctk.CTkFont(size=13),
-            text_color=COLORS["text_primary"],
+            font=_font(size=13),
+            text_color=Colors.TEXT_PRIMARY,
             anchor="w"
         )
         name_label.pack(fill="x", pady=(0, 6))
-        name_label.bind("<Button-1>", lambda e: on_click() if on_click else None)
+        if on_press:
+            name_label.bind("<Button-1>", on_press)
         
         # Explanation
         explanation_label = ctk.CTkLabel(
             content_frame,
             text=explanation,
-            font=ctk.CTkFont(size=11),
-            text_color=COLORS["text_secondary"],
+            font=_font(size=11),
+            text_color=Colors.TEXT_SECONDARY,
             anchor="w",
             wraplength=600
         )
         explanation_label.pack(fill="x")
-        explanation_label.bind("<Button-1>", lambda e: on_click() if on_click else None)
+        if on_press:
+            explanation_label.bind("<Button-1>", on_press)
         
         # Confirmation button (only shown if selected)
-        if is_selected and on_confirm:
-            confirm_frame = ctk.CTkFrame(self, fg_color="transparent")
-            confirm_frame.pack(fill="x", padx=15, pady=(0, 12))
+        if is_selected:
+            self._show_confirm()
+    
+    def set_selected(self, is_selected: bool):
+        """Restyle the card and show/hide its confirm button - a no-op if nothing changes"""
+        is_selected = bool(is_selected)
+        if is_selected == self.is_selected:
+            return
+        self.is_selected = is_selected
+        # configure() rejects a None colour, where the constructor falls back to the theme
+        self.configure(**{k: v for k, v in _SYMPTOM_CARD_STYLES[is_selected].items() if v is not None})
+        if is_selected:
+            self._show_confirm()
+        elif self.confirm_frame is not None:
+            self.confirm_frame.pack_forget()
+    
+    def _show_confirm(self):
+        """Pack the confirm button row, building it the first time"""
+        if not self.on_confirm:
+            return
+        if self.confirm_frame is None:
+            self.confirm_frame = ctk.CTkFrame(self, fg_color="transparent")
             
             confirm_btn = ctk.CTkButton(
-                confirm_frame,
+                self.confirm_frame,
                 text="Confirm Selection",
-                command=on_confirm,
+                command=self.on_confirm,
                 fg_color="#ffffff",
                 hover_color="#f0f0f0",
-                font=ctk.CTkFont(size=12),
+                font=_font(size=12),
                 height=32,
                 text_color="#000000",
                 width=200
             )
             confirm_btn.pack(side="left")
+        self.confirm_frame.pack(fill="x", padx=15, pady=(0, 12))
+
+
+def _relabel(widget, text):
+    """Configure a label's text only when it actually changes"""
+    if widget.cget("text") != text:
+        widget.configure(text=text)
+
+
+@lru_cache(maxsize=256)
+def _truncate(text: str, limit: int = 100) -> str:
+    """Shorten text to limit chars with an ellipsis; cached since cards are rebuilt on every update"""
+    return text[:limit] + "..." if len(text) > limit else text
 
 
 class DiagnosisCard(ctk.CTkFrame):
-    """Card for a single diagnosis result"""
+    """Card for a single diagnosis result. The card belongs to its rank slot: update_card
+    shows a different result in it without rebuilding the widgets."""
     
     def __init__(self, parent, rank: int, disease_name: str, probability: float,
                  severity: float = None, hits: int = None, req_hits: int = None,
                  description: str = None, **kwargs):
         
-        is_top = (rank == 1)
-        super().__init__(
-            parent,
-            fg_color=COLORS["card_bg"],
-            corner_radius=6,
-            border_width=1 if is_top else 0,
-            border_color=COLORS["selected"] if is_top else None,
-            **kwargs
-        )
+        super().__init__(parent, **_DIAGNOSIS_CARD_STYLES[rank == 1], **kwargs)
         
         # Header row with rank, name, and probability
         header_frame = ctk.CTkFrame(self, fg_color="transparent")
         header_frame.pack(fill="x", padx=15, pady=(12, 5))
+        header_frame.grid_columnconfigure(1, weight=1)
         
         rank_label = ctk.CTkLabel(
             header_frame,
             text=f"#{rank}",
-            font=ctk.CTkFont(size=13),
-            text_color=COLORS["accent"]
+            font=_font(size=13),
+            text_color=Colors.ACCENT_PRIMARY
         )
-        rank_label.pack(side="left")
+        rank_label.grid(row=0, column=0)
         
-        name_label = ctk.CTkLabel(
+        self.name_label = ctk.CTkLabel(
             header_frame,
             text=disease_name,
-            font=ctk.CTkFont(size=12),
-            text_color=COLORS["text_primary"]
+            font=_font(size=12),
+            text_color=Colors.TEXT_PRIMARY
         )
-        name_label.pack(side="left", padx=(10, 0))
+        self.name_label.grid(row=0, column=1, sticky="w", padx=(10, 0))
         
-        prob_label = ctk.CTkLabel(
+        self.prob_label = ctk.CTkLabel(
             header_frame,
             text=f"{probability:.1%}",
-            font=ctk.CTkFont(size=12),
-            text_color=COLORS["success"]
+            font=_font(size=12),
+            text_color=Colors.SUCCESS
         )
-        prob_label.pack(side="right")
+        self.prob_label.grid(row=0, column=2, sticky="e")
         
         # Progress bar
-        prob_bar = ctk.CTkProgressBar(
+        self.prob_bar = ctk.CTkProgressBar(
             self,
             width=400,
             height=8,
-            progress_color=COLORS["accent"]
+            progress_color=Colors.ACCENT_PRIMARY
         )
-        prob_bar.pack(fill="x", padx=15, pady=(0, 8))
-        prob_bar.set(probability)
-        
-        # Details row
-        details_frame = ctk.CTkFrame(self, fg_color="transparent")
-        details_frame.pack(fill="x", padx=15, pady=(0, 8))
-        
+        self.prob_bar.pack(fill="x", padx=15, pady=(0, 8))
+        self.prob_bar.set(probability)
+        self._probability = probability
+        
+        # Details row - gridded, so either label can be hidden and shown again in place
+        self.details_frame = ctk.CTkFrame(self, fg_color="transparent")
+        self.details_frame.pack(fill="x", padx=15, pady=(0, 8))
+        
+        # Optional labels, built the first time they have something to show
+        self.severity_label = None
+        self.hits_label = None
+        self.desc_label = None
+        self._update_details(severity, hits, req_hits, description)
+    
+    def update_card(self, disease_name: str, probability: float, severity: float = None,
+                    hits: int = None, req_hits: int = None, description: str = None):
+        """Show another result in this slot - labels are only reconfigured if their text changed"""
+        _relabel(self.name_label, disease_name)
+        _relabel(self.prob_label, f"{probability:.1%}")
+        if probability != self._probability:
+            self.prob_bar.set(probability)
+            self._probability = probability
+        self._update_details(severity, hits, req_hits, description)
+    
+    def _update_details(self, severity, hits, req_hits, description):
+        """Create, relabel or hide the severity / evidence / description labels"""
         if severity is not None:
-            severity_label = ctk.CTkLabel(
-                details_frame,
-                text=f"Severity: {severity:.2f}",
-                font=ctk.CTkFont(size=10),
-                text_color=COLORS["text_muted"]
-            )
-            severity_label.pack(side="left", padx=(0, 15))
+            text = f"Severity: {severity:.2f}"
+            if self.severity_label is None:
+                self.severity_label = ctk.CTkLabel(
+                    self.details_frame,
+                    text=text,
+                    font=_font(size=10),
+                    text_color=Colors.TEXT_TERTIARY
+                )
+            else:
+                _relabel(self.severity_label, text)
+            self.severity_label.grid(row=0, column=0, padx=(0, 15))
+        elif self.severity_label is not None:
+            self.severity_label.grid_remove()
         
         if hits is not None and req_hits is not None:
-            hits_label = ctk.CTkLabel(
-                details_frame,
-                text=f"Evidence: {hits}/{req_hits}",
-                font=ctk.CTkFont(size=10),
-                text_color=COLORS["text_dim"]
-            )
-            hits_label.pack(side="left")
-        
-        # Description if provided
+            text = f"Evidence: {hits}/{req_hits}"
+            if self.hits_label is None:
+                self.hits_label = ctk.CTkLabel(
+                    self.details_frame,
+                    text=text,
+                    font=_font(size=10),
+                    text_color=Colors.TEXT_DISABLED
+                )
+            else:
+                _relabel(self.hits_label, text)
+            self.hits_label.grid(row=0, column=1)
+        elif self.hits_label is not None:
+            self.hits_label.grid_remove()
+        
+        # Description if provided - always the last thing in the card, so re-packing it
+        # after a pack_forget puts it back where it was
         if description:
-            desc_label = ctk.CTkLabel(
-                self,
-                text=description[:100] + ("..." if len(description) > 100 else ""),
-                font=ctk.CTkFont(size=10),
-                text_color=COLORS["text_secondary"],
-                wraplength=400,
-                justify="left"
-            )
-            desc_label.pack(fill="x", padx=15, pady=(0, 10))
+            text = _truncate(description)
+            if self.desc_label is None:
+                self.desc_label = ctk.CTkLabel(
+                    self,
+                    text=text,
+                    font=_font(size=10),
+                    text_color=Colors.TEXT_SECONDARY,
+                    wraplength=400,
+                    justify="left"
+                )
+            else:
+                _relabel(self.desc_label, text)
+            self.desc_label.pack(fill="x", padx=15, pady=(0, 10))
+        elif self.desc_label is not None:
+            self.desc_label.pack_forget()
+
+def _rule(parent):
+    """1px horizontal rule. A plain Tk frame, as a CTkFrame would bring its own canvas
+    and redraw logic just to paint a single line."""
+    return tk.Frame(parent, height=1, bg=Colors.BORDER, bd=0, highlightthickness=0)
+
+
+def _tframe(parent, **kwargs):
+    """Transparent layout-only CTkFrame. corner_radius=0 so CustomTkinter draws no rounded
+    background shape for a frame that is never seen."""
+    return ctk.CTkFrame(parent, fg_color="transparent", corner_radius=0, **kwargs)
 
 
 class CompletionSummary(ctk.CTkFrame):
-    """Summary display shown when diagnosis is complete"""
+    """Summary display shown when diagnosis is complete. Top Diagnoses lists at most
+    MAX_TOP_DISEASES entries, whatever the caller passes."""
+    
+    MAX_TOP_DISEASES = 10
+    # Table rows built per event-loop turn once the summary is on screen
+    ROWS_PER_CHUNK = 5
     
     def __init__(self, parent, stats_data: List[Tuple[str, str]], 
                  top_disease_name: str = "", top_diseases: List[Tuple[int, str, float, int, int]] = None,
@@ -936,298 +1078,378 @@ class CompletionSummary(ctk.CTkFrame):
         
         super().__init__(
             parent,
-            fg_color=COLORS["bg_medium"],
+            fg_color=Colors.BG_SECONDARY,
             corner_radius=8,
             **kwargs
         )
         
         # Title section with "Patient suffers from:" label and disease name
-        title_frame = ctk.CTkFrame(self, fg_color="transparent")
+        title_frame = self._title_frame = _tframe(self)
         title_frame.pack(fill="x", padx=20, pady=(20, 15))
         
-        # Disease name section
-        disease_frame = ctk.CTkFrame(title_frame, fg_color="transparent")
-        disease_frame.pack(fill="x", anchor="w")
-        
         # Semi-transparent "Patient suffers from:" label
         patient_label = ctk.CTkLabel(
-            disease_frame,
+            title_frame,
             text="Patient suffers from:",
-            font=ctk.CTkFont(size=11),
-            text_color=COLORS["text_muted"]
+            font=_font(size=11),
+            text_color=Colors.TEXT_TERTIARY
         )
         patient_label.pack(anchor="w", pady=(0, 4))
         
         # Top disease name - bigger and left-aligned
+        self._disease_label = None
         if top_disease_name:
-            disease_label = ctk.CTkLabel(
-                disease_frame,
-                text=top_disease_name,
-                font=ctk.CTkFont(size=24, weight="bold"),
-                text_color=COLORS["text_primary"],
-                anchor="w"
-            )
-            disease_label.pack(anchor="w")
+            self._set_disease_name(top_disease_name)
         
         # Stats section with improved table-like layout
-        stats_frame = ctk.CTkFrame(self, fg_color=COLORS["bg_light"], corner_radius=6)
+        stats_frame = ctk.CTkFrame(self, fg_color=Colors.BG_TERTIARY, corner_radius=6)
         stats_frame.pack(fill="x", padx=20, pady=(0, 15))
         
         stats_title = ctk.CTkLabel(
             stats_frame,
             text="Session Statistics",
-            font=ctk.CTkFont(size=15, weight="bold"),
-            text_color=COLORS["text_primary"]
+            font=_font(size=15, weight="bold"),
+            text_color=Colors.TEXT_PRIMARY
         )
         stats_title.pack(pady=(18, 8), padx=20, anchor="w")
         
-        # Create a table-like structure for stats
-        stats_table = ctk.CTkFrame(stats_frame, fg_color="transparent")
+        # Create a table-like structure for stats: a two-column grid whose label column
+        # is held at 200px, so rows line up without a fixed-size wrapper frame per label
+        stats_table = self._stats_table = _tframe(stats_frame)
         stats_table.pack(fill="x", padx=20, pady=(0, 12))
+        stats_table.grid_columnconfigure(0, minsize=200)
+        stats_table.grid_columnconfigure(1, weight=1)
+        
+        self._stat_rows = []
+        self._stats_shown = 0
+        self._add_stat_rows(stats_data)
+        
+        # Top diagnoses section. Its frame and header go in now, in order; the rows are
+        # filled in a few at a time so the summary appears immediately
+        self._build_job = None
+        self._top_diseases_frame = None
+        if top_diseases:
+            self._pending_rows = self._build_top_diseases(top_diseases[:self.MAX_TOP_DISEASES])
+            self._build_job = self.after_idle(self._build_next_chunk)
         
-        # Calculate column widths for proper alignment
-        max_label_width = max(len(label) for label, _ in stats_data) if stats_data else 0
+        # Symptom path section
+        self._path_text = None
+        if symptom_path:
+            self._build_symptom_path(symptom_path)
         
-        # Display stats in a two-column grid with proper alignment
-        for i, (label, value) in enumerate(stats_data):
-            row_frame = ctk.CTkFrame(stats_table, fg_color="transparent", height=10)
-            row_frame.pack(fill="x", pady=0)
+        # New Diagnosis button - white with black text (keep same as before)
+        if on_new_diagnosis:
+            new_diag_btn = ctk.CTkButton(
+                self,
+                text="Start New Diagnosis",
+                command=on_new_diagnosis,
+                fg_color="#ffffff",
+                hover_color="#f0f0f0",
+                font=_font(size=12),
+                height=32,
+                width=200,
+                text_color="#000000",
+                border_width=0
+            )
+            new_diag_btn.pack(pady=(5, 20))
+    
+    def update_summary(self, stats_data: List[Tuple[str, str]], top_disease_name: str = "",
+                       top_diseases: List[Tuple[int, str, float, int, int]] = None,
+                       symptom_path: List[str] = None):
+        """Refresh the summary in place - only changed cells are relabelled, and rows are
+        added or hidden as the counts change. (Not update(): that is Tk's event pump.)
+        Top Diagnoses / Symptom Path sections only refresh if they were built initially."""
+        if top_disease_name:
+            self._set_disease_name(top_disease_name)
+        
+        # Stats rows: relabel the ones that stay, grid_remove/restore the rest
+        keep = min(len(stats_data), len(self._stat_rows))
+        for i, ((label, value), widgets) in enumerate(zip(stats_data, self._stat_rows)):
+            _relabel(widgets[1], label)
+            _relabel(widgets[2], value)
+            if i >= self._stats_shown:
+                for widget in filter(None, widgets):
+                    widget.grid()
+        for widgets in self._stat_rows[keep:self._stats_shown]:
+            for widget in filter(None, widgets):
+                widget.grid_remove()
+        self._stats_shown = keep
+        self._add_stat_rows(stats_data[keep:])
+        
+        # Top Diagnoses rows - finish any chunked build first so every row exists. Hidden
+        # rows are always the trailing ones, so re-packing them in order keeps the order
+        if self._top_diseases_frame is not None:
+            if self._build_job is not None:
+                self.after_cancel(self._build_job)
+                self._build_job = None
+                for _ in self._pending_rows:
+                    pass
+            disease_rows = self._format_disease_rows((top_diseases or [])[:self.MAX_TOP_DISEASES])
+            keep = min(len(disease_rows), len(self._disease_cells))
+            for i, (texts, (divider, disease_row, cells)) in enumerate(zip(disease_rows, self._disease_cells)):
+                for cell, text in zip(cells, texts):
+                    _relabel(cell, text)
+                if i >= self._disease_rows_shown:
+                    self._pack_disease_row(divider, disease_row)
+            for divider, disease_row, _ in self._disease_cells[keep:self._disease_rows_shown]:
+                if divider is not None:
+                    divider.pack_forget()
+                disease_row.pack_forget()
+            self._disease_rows_shown = keep
+            for _ in self._disease_rows(disease_rows[keep:]):
+                pass
+        
+        # Symptom path - a textbox, so just refill it if the path changed
+        if self._path_text is not None and list(symptom_path or []) != self._symptom_path:
+            self._path_text.configure(state="normal")
+            self._path_text.delete("1.0", "end")
+            self._fill_symptom_path(symptom_path or [])
+    
+    def _set_disease_name(self, top_disease_name):
+        """Show the top disease name, creating its label the first time"""
+        if self._disease_label is None:
+            self._disease_label = ctk.CTkLabel(
+                self._title_frame,
+                text=top_disease_name,
+                font=_font(size=24, weight="bold"),
+                text_color=Colors.TEXT_PRIMARY,
+                anchor="w"
+            )
+            self._disease_label.pack(anchor="w")
+        else:
+            _relabel(self._disease_label, top_disease_name)
+    
+    def _add_stat_rows(self, stats_data):
+        """Append label/value rows to the stats grid, each below a divider but the first"""
+        stats_table = self._stats_table
+        text_primary, text_secondary = Colors.TEXT_PRIMARY, Colors.TEXT_SECONDARY
+        for i, (label, value) in enumerate(stats_data, len(self._stat_rows)):
+            row = 2 * i  # odd grid rows hold the dividers
             
-            # Left column (label)
-            label_frame = ctk.CTkFrame(row_frame, fg_color="transparent", width=200, height=10)
-            label_frame.pack(side="left", fill="x", expand=False)
-            label_frame.pack_propagate(False)
+            # Add subtle divider between rows (above all but the first)
+            divider = None
+            if i:
+                divider = _rule(stats_table)
+                divider.grid(row=row - 1, column=0, columnspan=2, sticky="ew")
             
+            # Left column (label)
             label_widget = ctk.CTkLabel(
-                label_frame,
+                stats_table,
                 text=label,
-                font=ctk.CTkFont(size=10),
-                text_color=COLORS["text_secondary"],
+                font=_font(size=10),
+                text_color=text_secondary,
                 anchor="w",
-
             )
-            label_widget.pack(side="left", padx=(0, 8), pady=0)
-            
-            # # Separator
-            # separator = ctk.CTkLabel(
-            #     row_frame,
-            #     text=":",
-            #     font=ctk.CTkFont(size=10),
-            #     text_color=COLORS["text_muted"],
-            #     height=16
-            # )
-            # separator.pack(side="left", padx=(0, 12), pady=0)
+            label_widget.grid(row=row, column=0, sticky="w", padx=(0, 8))
             
             # Right column (value)
             value_widget = ctk.CTkLabel(
-                row_frame,
+                stats_table,
                 text=value,
-                font=ctk.CTkFont(size=10, weight="bold"),
-                text_color=COLORS["text_primary"],
+                font=_font(size=10, weight="bold"),
+                text_color=text_primary,
                 anchor="w",
-
             )
-            value_widget.pack(side="left", fill="x", expand=True, pady=0)
-        
-            # Add subtle divider between rows (except last)
-            if i < len(stats_data) - 1:
-                divider = ctk.CTkFrame(
-                    stats_table,
-                    fg_color=COLORS["border"],
-                    height=1
-                )
-                divider.pack(fill="x", padx=0, pady=0)
-        
-        # Top diagnoses section with improved layout
-        if top_diseases:
-            top_diseases_frame = ctk.CTkFrame(self, fg_color=COLORS["bg_light"], corner_radius=6)
-            top_diseases_frame.pack(fill="x", padx=20, pady=(0, 15))
-            
-            top_title = ctk.CTkLabel(
-                top_diseases_frame,
-                text="Top Diagnoses",
-                font=ctk.CTkFont(size=15, weight="bold"),
-                text_color=COLORS["text_primary"]
-            )
-            top_title.pack(pady=(18, 12), padx=20, anchor="w")
+            value_widget.grid(row=row, column=1, sticky="ew")
             
-            # Header row for table
-            header_frame = ctk.CTkFrame(top_diseases_frame, fg_color="transparent")
-            header_frame.pack(fill="x", padx=20, pady=(0, 8))
+            self._stat_rows.append((divider, label_widget, value_widget))
+            self._stats_shown += 1
+    
+    def _build_next_chunk(self):
+        """Build the next ROWS_PER_CHUNK queued rows, rescheduling until none are left"""
+        built = sum(1 for _ in islice(self._pending_rows, self.ROWS_PER_CHUNK))
+        self._build_job = self.after(1, self._build_next_chunk) if built == self.ROWS_PER_CHUNK else None
+    
+    def destroy(self):
+        if self._build_job is not None:
+            self.after_cancel(self._build_job)
+            self._build_job = None
+        super().destroy()
+    
+    def _build_top_diseases(self, top_diseases):
+        """Top Diagnoses table: builds the title and header row, and returns a generator
+        that adds one disease row per step"""
+        top_diseases_frame = self._top_diseases_frame = ctk.CTkFrame(self, fg_color=Colors.BG_TERTIARY, corner_radius=6)
+        top_diseases_frame.pack(fill="x", padx=20, pady=(0, 15))
+        
+        top_title = ctk.CTkLabel(
+            top_diseases_frame,
+            text="Top Diagnoses",
+            font=_font(size=15, weight="bold"),
+            text_color=Colors.TEXT_PRIMARY
+        )
+        top_title.pack(pady=(18, 12), padx=20, anchor="w")
+        
+        # Header row for table
+        header_frame = _tframe(top_diseases_frame)
+        header_frame.pack(fill="x", padx=20, pady=(0, 8))
+        header_frame.grid_columnconfigure(1, weight=1)
+        
+        rank_header = ctk.CTkLabel(
+            header_frame,
+            text="Rank",
+            font=_font(size=11, weight="bold"),
+            text_color=Colors.TEXT_TERTIARY,
+            width=50
+        )
+        rank_header.grid(row=0, column=0, padx=(0, 15))
+        
+        name_header = ctk.CTkLabel(
+            header_frame,
+            text="Disease",
+            font=_font(size=11, weight="bold"),
+            text_color=Colors.TEXT_TERTIARY,
+            anchor="w"
+        )
+        name_header.grid(row=0, column=1, sticky="ew", padx=(0, 15))
+        
+        prob_header = ctk.CTkLabel(
+            header_frame,
+            text="Probability",
+            font=_font(size=11, weight="bold"),
+            text_color=Colors.TEXT_TERTIARY,
+            width=100
+        )
+        prob_header.grid(row=0, column=2, padx=(0, 15))
+        
+        hits_header = ctk.CTkLabel(
+            header_frame,
+            text="Evidence",
+            font=_font(size=11, weight="bold"),
+            text_color=Colors.TEXT_TERTIARY,
+            width=80
+        )
+        hits_header.grid(row=0, column=3, sticky="e")
+        
+        # Divider after header
+        header_divider = _rule(top_diseases_frame)
+        header_divider.pack(fill="x", padx=20, pady=(0, 8))
+        
+        # (divider, row frame, cell labels) per disease row, as built
+        self._disease_cells = []
+        self._disease_rows_shown = 0
+        return self._disease_rows(self._format_disease_rows(top_diseases))
+    
+    @staticmethod
+    def _format_disease_rows(top_diseases):
+        """Format all the cell text up front so the row loop only builds widgets"""
+        return [
+            (f"#{rank}", disease_name, f"{probability:.1%}", f"{hits}/{req_hits}")
+            for rank, (_, disease_name, probability, hits, req_hits) in enumerate(top_diseases, 1)
+        ]
+    
+    def _pack_disease_row(self, divider, disease_row):
+        # Divider between rows (above all but the first)
+        if divider is not None:
+            divider.pack(fill="x", padx=20, pady=2)
+        disease_row.pack(fill="x", padx=20, pady=8)
+    
+    def _disease_rows(self, disease_rows):
+        """Append a Top Diagnoses row per entry, yielding once per row built"""
+        top_diseases_frame = self._top_diseases_frame
+        accent, success = Colors.ACCENT_PRIMARY, Colors.SUCCESS
+        text_primary, text_secondary = Colors.TEXT_PRIMARY, Colors.TEXT_SECONDARY
+        for rank_text, disease_name, prob_text, hits_text in disease_rows:
+            divider = _rule(top_diseases_frame) if self._disease_cells else None
+            disease_row = _tframe(top_diseases_frame)
+            disease_row.grid_columnconfigure(1, weight=1)
+            self._pack_disease_row(divider, disease_row)
             
-            rank_header = ctk.CTkLabel(
-                header_frame,
-                text="Rank",
-                font=ctk.CTkFont(size=11, weight="bold"),
-                text_color=COLORS["text_muted"],
+            # Rank badge
+            rank_badge = ctk.CTkLabel(
+                disease_row,
+                text=rank_text,
+                font=_font(size=11, weight="bold"),
+                text_color=accent,
                 width=50
             )
-            rank_header.pack(side="left", padx=(0, 15))
+            rank_badge.grid(row=0, column=0, padx=(0, 15))
             
-            name_header = ctk.CTkLabel(
-                header_frame,
-                text="Disease",
-                font=ctk.CTkFont(size=11, weight="bold"),
-                text_color=COLORS["text_muted"],
+            # Disease name
+            name_label = ctk.CTkLabel(
+                disease_row,
+                text=disease_name,
+                font=_font(size=12, weight="bold"),
+                text_color=text_primary,
                 anchor="w"
             )
-            name_header.pack(side="left", fill="x", expand=True, padx=(0, 15))
+            name_label.grid(row=0, column=1, sticky="ew", padx=(0, 15))
             
-            prob_header = ctk.CTkLabel(
-                header_frame,
-                text="Probability",
-                font=ctk.CTkFont(size=11, weight="bold"),
-                text_color=COLORS["text_muted"],
+            # Probability
+            prob_label = ctk.CTkLabel(
+                disease_row,
+                text=prob_text,
+                font=_font(size=11, weight="bold"),
+                text_color=success,
                 width=100
             )
-            prob_header.pack(side="left", padx=(0, 15))
+            prob_label.grid(row=0, column=2, padx=(0, 15))
             
-            hits_header = ctk.CTkLabel(
-                header_frame,
-                text="Evidence",
-                font=ctk.CTkFont(size=11, weight="bold"),
-                text_color=COLORS["text_muted"],
+            # Evidence hits
+            hits_label = ctk.CTkLabel(
+                disease_row,
+                text=hits_text,
+                font=_font(size=11),
+                text_color=text_secondary,
                 width=80
             )
-            hits_header.pack(side="right")
+            hits_label.grid(row=0, column=3, sticky="e")
             
-            # Divider after header
-            header_divider = ctk.CTkFrame(
-                top_diseases_frame,
-                fg_color=COLORS["border"],
-                height=1
-            )
-            header_divider.pack(fill="x", padx=20, pady=(0, 8))
-            
-            # Disease rows
-            for i, (disease_id, disease_name, probability, hits, req_hits) in enumerate(top_diseases):
-                disease_row = ctk.CTkFrame(top_diseases_frame, fg_color="transparent")
-                disease_row.pack(fill="x", padx=20, pady=8)
-                
-                # Rank badge
-                rank_badge = ctk.CTkLabel(
-                    disease_row,
-                    text=f"#{i+1}",
-                    font=ctk.CTkFont(size=11, weight="bold"),
-                    text_color=COLORS["accent"],
-                    width=50
-                )
-                rank_badge.pack(side="left", padx=(0, 15))
-                
-                # Disease name
-                name_label = ctk.CTkLabel(
-                    disease_row,
-                    text=disease_name,
-                    font=ctk.CTkFont(size=12, weight="bold"),
-                    text_color=COLORS["text_primary"],
-                    anchor="w"
-                )
-                name_label.pack(side="left", fill="x", expand=True, padx=(0, 15))
-                
-                # Probability
-                prob_label = ctk.CTkLabel(
-                    disease_row,
-                    text=f"{probability:.1%}",
-                    font=ctk.CTkFont(size=11, weight="bold"),
-                    text_color=COLORS["success"],
-                    width=100
-                )
-                prob_label.pack(side="left", padx=(0, 15))
-                
-                # Evidence hits
-                hits_label = ctk.CTkLabel(
-                    disease_row,
-                    text=f"{hits}/{req_hits}",
-                    font=ctk.CTkFont(size=11),
-                    text_color=COLORS["text_secondary"],
-                    width=80
-                )
-                hits_label.pack(side="right")
-        
-                # Divider between rows (except last)
-                if i < len(top_diseases) - 1:
-                    row_divider = ctk.CTkFrame(
-                        top_diseases_frame,
-                        fg_color=COLORS["border"],
-                        height=1
-                    )
-                    row_divider.pack(fill="x", padx=20, pady=2)
+            self._disease_cells.append((divider, disease_row, (rank_badge, name_label, prob_label, hits_label)))
+            self._disease_rows_shown += 1
+            yield
+    
+    def _build_symptom_path(self, symptom_path):
+        """Numbered, scrollable list of the symptoms chosen this session. A single read-only
+        textbox, rather than a scrollable frame holding a row frame and two labels per step."""
+        symptom_path_frame = ctk.CTkFrame(self, fg_color=Colors.BG_TERTIARY, corner_radius=6)
+        symptom_path_frame.pack(fill="x", padx=20, pady=(0, 15))
+        
+        path_title = ctk.CTkLabel(
+            symptom_path_frame,
+            text="Symptom Path",
+            font=_font(size=15, weight="bold"),
+            text_color=Colors.TEXT_PRIMARY
+        )
+        path_title.pack(pady=(18, 12), padx=20, anchor="w")
         
-        # Symptom path section
-        if symptom_path:
-            symptom_path_frame = ctk.CTkFrame(self, fg_color=COLORS["bg_light"], corner_radius=6)
-            symptom_path_frame.pack(fill="x", padx=20, pady=(0, 15))
-            
-            path_title = ctk.CTkLabel(
-                symptom_path_frame,
-                text="Symptom Path",
-                font=ctk.CTkFont(size=15, weight="bold"),
-                text_color=COLORS["text_primary"]
-            )
-            path_title.pack(pady=(18, 12), padx=20, anchor="w")
-            
-            # Create scrollable path
-            path_scroll = ctk.CTkScrollableFrame(
-                symptom_path_frame,
-                fg_color=COLORS["bg_light"],
-                corner_radius=6,
-                height=150
-            )
-            path_scroll.pack(fill="both", expand=True, padx=20, pady=(0, 18))
-            
-            # Display symptoms in order with numbers
-            for i, symptom in enumerate(symptom_path, 1):
-                symptom_row = ctk.CTkFrame(path_scroll, fg_color="transparent")
-                symptom_row.pack(fill="x", pady=4)
-                
-                # Step number
-                step_label = ctk.CTkLabel(
-                    symptom_row,
-                    text=f"{i}.",
-                    font=ctk.CTkFont(size=11, weight="bold"),
-                    text_color=COLORS["accent"],
-                    width=30
-                )
-                step_label.pack(side="left", padx=(0, 10))
-                
-                # Symptom name
-                symptom_label = ctk.CTkLabel(
-                    symptom_row,
-                    text=symptom,
-                    font=ctk.CTkFont(size=12),
-                    text_color=COLORS["text_primary"],
-                    anchor="w"
-                )
-                symptom_label.pack(side="left", fill="x", expand=True)
+        path_text = self._path_text = ctk.CTkTextbox(
+            symptom_path_frame,
+            fg_color=Colors.BG_TERTIARY,
+            text_color=Colors.TEXT_PRIMARY,
+            font=_font(size=12),
+            corner_radius=6,
+            border_width=0,
+            height=150,
+            wrap="word"
+        )
+        path_text.pack(fill="both", expand=True, padx=20, pady=(0, 18))
+        path_text.tag_config("step", foreground=Colors.ACCENT_PRIMARY)
+        self._fill_symptom_path(symptom_path)
+    
+    def _fill_symptom_path(self, symptom_path):
+        """Write the numbered symptoms into the (empty) path textbox and lock it"""
+        path_text = self._path_text
+        self._symptom_path = list(symptom_path)
         
-        # New Diagnosis button - white with black text (keep same as before)
-        if on_new_diagnosis:
-            new_diag_btn = ctk.CTkButton(
-                self,
-                text="Start New Diagnosis",
-                command=on_new_diagnosis,
-                fg_color="#ffffff",
-                hover_color="#f0f0f0",
-                font=ctk.CTkFont(size=12),
-                height=32,
-                width=200,
-                text_color="#000000",
-                border_width=0
-            )
-            new_diag_btn.pack(pady=(5, 20))
+        # Display symptoms in order with numbers
+        for i, symptom in enumerate(symptom_path, 1):
+            path_text.insert("end", f"{i}.  ", "step")
+            path_text.insert("end", f"{symptom}\n")
+        path_text.configure(state="disabled")
 
 
 class ConfidenceIndicator(ctk.CTkFrame):
     """Displays confidence level with progress bar"""
     
     def __init__(self, parent, confidence: float = 0.0, **kwargs):
-        super().__init__(parent, fg_color=COLORS["bg_light"], corner_radius=8, **kwargs)
+        super().__init__(parent, fg_color=Colors.BG_TERTIARY, corner_radius=8, **kwargs)
         
         self.confidence_label = ctk.CTkLabel(
             self,
             text=f"Confidence: {confidence:.1%}",
-            font=ctk.CTkFont(size=14),
-            text_color=COLORS["text_primary"]
+            font=_font(size=14),
+            text_color=Colors.TEXT_PRIMARY
         )
         self.confidence_label.pack(pady=15)
         
@@ -1235,16 +1457,24 @@ class ConfidenceIndicator(ctk.CTkFrame):
             self,
             width=400,
             height=20,
-            progress_color=COLORS["accent"]
+            progress_color=Colors.ACCENT_PRIMARY
         )
         self.confidence_progress.pack(pady=(0, 15), padx=20)
         self.confidence_progress.set(confidence)
+        self._last_text = None
+        self._last_band = None
     
     def update_confidence(self, confidence: float):
-        """Update confidence display"""
+        """Update confidence display (no-op if the displayed value is unchanged)"""
+        text = f"Confidence: {confidence:.1%}"
+        band = confidence >= 0.7
+        if text == self._last_text and band == self._last_band:
+            return
+        self._last_text = text
+        self._last_band = band
         self.confidence_label.configure(
-            text=f"Confidence: {confidence:.1%}",
-            text_color=COLORS["success"] if confidence >= 0.7 else COLORS["text_primary"]
+            text=text,
+            text_color=Colors.SUCCESS if band else Colors.TEXT_PRIMARY
         )
         self.confidence_progress.set(confidence)
 
@@ -1261,8 +1491,8 @@ class PanelHeader(ctk.CTkFrame):
         title_label = ctk.CTkLabel(
             self,
             text=title,
-            font=ctk.CTkFont(size=16),
-            text_color=COLORS["text_primary"]
+            font=_font(size=16),
+            text_color=Colors.TEXT_PRIMARY
         )
         title_label.pack(side="left")
         
@@ -1271,8 +1501,8 @@ class PanelHeader(ctk.CTkFrame):
             self.status_label = ctk.CTkLabel(
                 self,
                 text=status_text,
-                font=ctk.CTkFont(size=11),
-                text_color=COLORS["text_muted"]
+                font=_font(size=11),
+                text_color=Colors.TEXT_TERTIARY
             )
             self.status_label.pack(side="right", padx=(0, 10))
         else:
@@ -1284,14 +1514,14 @@ class PanelHeader(ctk.CTkFrame):
                 self,
                 text=action_text,
                 command=action_command,
-                fg_color=COLORS["bg_light"],
-                hover_color=COLORS["bg_hover"],
-                font=ctk.CTkFont(size=12),
+                fg_color=Colors.BG_TERTIARY,
+                hover_color=Colors.BG_HOVER,
+                font=_font(size=12),
                 width=80,
                 height=28,
-                text_color=COLORS["text_secondary"],
+                text_color=Colors.TEXT_SECONDARY,
                 border_width=1,
-                border_color=COLORS["border"]
+                border_color=Colors.BORDER
             )
             action_btn.pack(side="right", padx=(10, 0))
             self.action_btn = action_btn
@@ -1302,26 +1532,3 @@ class PanelHeader(ctk.CTkFrame):
         """Update status label"""
         if self.status_label:
             self.status_label.configure(text=status_text)
-
-
-class Grid(BaseFrame):
-    """Grid layout helper"""
-    
-    def __init__(self, parent, columns: int = 2, gap: int = Spacing.MD, **kwargs):
-        super().__init__(parent, bg_color="transparent", corner_radius=0, **kwargs)
-        self.pack(fill="both", expand=True)
-        
-        self.columns = columns
-        self.gap = gap
-        self.cell_count = 0
-    
-    def add_item(self, widget, **pack_kwargs):
-        """Add item to grid"""
-        row = self.cell_count // self.columns
-        col = self.cell_count % self.columns
-        
-        padx = (self.gap if col > 0 else 0, 0)
-        pady = (self.gap if row > 0 else 0, 0)
-        
-        widget.pack(fill="both", expand=True, padx=padx, pady=pady, **pack_kwargs)
-        self.cell_count += 1
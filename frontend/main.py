@@ -7,8 +7,10 @@ Completely redesigned with coherent design system inspired by Palantir
 import sys
 import os
 import argparse
+import heapq
+import importlib.util
 from pathlib import Path
-from collections import defaultdict
+from collections import Counter
 
 # Add parent directory to path to import inference module
 # Handle PyInstaller executable case
@@ -29,7 +31,9 @@ else:
 
 try:
     import customtkinter as ctk
-    from PIL import Image, ImageTk
+    # Pillow is only required, never used directly: probe for it without importing its C extensions
+    if importlib.util.find_spec("PIL") is None:
+        raise ImportError("No module named 'PIL'")
 except ImportError:
     print("ERROR: Required packages not installed.")
     print("Please run: pip install -r requirements.txt")
@@ -38,7 +42,7 @@ except ImportError:
 # Import design system
 try:
     from design_system import (
-        COLORS, Colors, Typography, Spacing, Radius,
+        Colors, Typography, Spacing, Radius,
         TopBar, SymptomCard, DiagnosisCard, CompletionSummary,
         ConfidenceIndicator, PanelHeader
     )
@@ -54,9 +58,11 @@ try:
         update_posteriors_positive,
         calculate_confidence,
         explain_symptom,
-        categorize_symptom,
+        cluster_index,
         compute_scarcity_boosts,
-        dynamic_required_hits,
+        build_evidence_index,
+        build_lr_table,
+        compute_required_hits,
         CLUSTERS,
         SUCCESS_CONFIDENCE,
         MIN_EVIDENCE_ANSWERS,
@@ -74,6 +80,9 @@ ctk.set_default_color_theme("blue")
 class DiagnosticApp(ctk.CTk):
     """Main application window with Palantir-inspired design system"""
     
+    # Search results render once typing pauses for this long, not on every keystroke
+    SEARCH_DEBOUNCE_MS = 120
+    
     def __init__(self, db_path="pediatric.db"):
         super().__init__()
         
@@ -81,19 +90,24 @@ class DiagnosticApp(ctk.CTk):
         self.diseases = {}
         self.priors = {}
         self.symptom_map = {}
+        self.symptom_names = []  # (symptom, symptom.lower()) for search
+        self.lr_table = {}
+        self.evidence_index = {}
+        self.req_hits_by_disease = {}
         
         # Diagnostic state
         self.candidates = {}
         self.asked = set()
         self.symptom_path = []  # Track order of symptoms selected
         self.answered_with_lr = 0
-        self.evidence_hits_by_disease = defaultdict(int)
-        self.cluster_strength = {c: 0.0 for c in CLUSTERS}
+        self.evidence_hits_by_disease = Counter()
+        self.cluster_strength = [0.0] * len(CLUSTERS)
         self.scarcity_boosts = {}
         self.consecutive_low_gain = 0
         
         # UI state
         self.current_symptoms = []
+        self._next_cache = (None, [])  # (state key, ranked suggestions) - see get_next_symptoms
         self.diagnosis_finalized = False
         self.selected_symptom = None
         
@@ -135,7 +149,11 @@ class DiagnosticApp(ctk.CTk):
                     # Fallback: let load_data() try to find it
                     self.diseases, self.priors, self.symptom_map = load_data(self.db_path)
             
-            self.scarcity_boosts = compute_scarcity_boosts(self.symptom_map, list(self.diseases.keys()))
+            self.symptom_names = [(s, s.lower()) for s in self.symptom_map]
+            self.evidence_index = build_evidence_index(self.symptom_map)
+            self.scarcity_boosts = compute_scarcity_boosts(self.evidence_index, list(self.diseases.keys()))
+            self.lr_table = build_lr_table(self.symptom_map)
+            self.req_hits_by_disease = compute_required_hits(self.evidence_index, list(self.diseases.keys()))
         except Exception as e:
             self.show_error(f"Failed to load database: {e}")
             sys.exit(1)
@@ -160,11 +178,11 @@ class DiagnosticApp(ctk.CTk):
         content_frame.pack(fill="both", expand=True)
         
         # Left column - Symptom selection (60% width)
-        left_panel = ctk.CTkFrame(content_frame, fg_color=COLORS["bg_medium"], corner_radius=8)
+        left_panel = ctk.CTkFrame(content_frame, fg_color=Colors.BG_SECONDARY, corner_radius=8)
         left_panel.pack(side="left", fill="both", expand=True, padx=(0, 10))
         
         # Right column - Diagnosis results (40% width)
-        right_panel = ctk.CTkFrame(content_frame, fg_color=COLORS["bg_medium"], corner_radius=8)
+        right_panel = ctk.CTkFrame(content_frame, fg_color=Colors.BG_SECONDARY, corner_radius=8)
         right_panel.pack(side="right", fill="both", expand=False, padx=(10, 0), ipadx=20)
         right_panel.configure(width=500)
         
@@ -195,11 +213,11 @@ class DiagnosticApp(ctk.CTk):
             placeholder_text="Search for a symptom",
             font=ctk.CTkFont(size=13),
             height=36,
-            fg_color=COLORS["bg_light"],
+            fg_color=Colors.BG_TERTIARY,
             border_width=1,
-            border_color=COLORS["border"],
-            text_color=COLORS["text_primary"],
-            placeholder_text_color=COLORS["text_muted"]  # Muted white/gray for placeholder
+            border_color=Colors.BORDER,
+            text_color=Colors.TEXT_PRIMARY,
+            placeholder_text_color=Colors.TEXT_TERTIARY  # Muted white/gray for placeholder
         )
         self.search_entry.pack(fill="x", side="left", expand=True, padx=(0, 10))
         self.search_entry.bind("<KeyRelease>", self.on_search_change)
@@ -215,15 +233,16 @@ class DiagnosticApp(ctk.CTk):
         # Scrollable symptom list
         scroll_frame = ctk.CTkScrollableFrame(
             self.symptom_content_frame,
-            fg_color=COLORS["bg_light"],
+            fg_color=Colors.BG_TERTIARY,
             corner_radius=6
         )
         scroll_frame.pack(fill="both", expand=True, padx=20, pady=(0, 20))
         
         self.symptom_scroll_frame = scroll_frame
-        self.symptom_buttons = []
+        self.symptom_buttons = {}  # symptom -> SymptomCard, in on-screen order
         self.selected_symptom = None  # Track currently selected symptom
         self.search_query = ""  # Track current search query
+        self._search_after_id = None  # Pending debounced search render
     
     def create_diagnosis_panel(self, parent):
         """Create diagnosis results panel"""
@@ -232,7 +251,7 @@ class DiagnosticApp(ctk.CTk):
             parent,
             text="Diagnosis Results",
             font=ctk.CTkFont(size=16),
-            text_color=COLORS["text_primary"]
+            text_color=Colors.TEXT_PRIMARY
         )
         header.pack(pady=(20, 10))
         
@@ -245,14 +264,14 @@ class DiagnosticApp(ctk.CTk):
             parent,
             text="Top Diagnoses",
             font=ctk.CTkFont(size=13),
-            text_color=COLORS["text_secondary"]
+            text_color=Colors.TEXT_SECONDARY
         )
         diagnoses_label.pack(pady=(10, 10))
         
         # Scrollable diagnoses
         diagnoses_scroll = ctk.CTkScrollableFrame(
             parent,
-            fg_color=COLORS["bg_light"],
+            fg_color=Colors.BG_TERTIARY,
             corner_radius=8
         )
         diagnoses_scroll.pack(fill="both", expand=True, padx=20, pady=(0, 20))
@@ -266,8 +285,8 @@ class DiagnosticApp(ctk.CTk):
         self.asked = set()
         self.symptom_path = []
         self.answered_with_lr = 0
-        self.evidence_hits_by_disease = defaultdict(int)
-        self.cluster_strength = {c: 0.0 for c in CLUSTERS}
+        self.evidence_hits_by_disease = Counter()
+        self.cluster_strength = [0.0] * len(CLUSTERS)
         self.consecutive_low_gain = 0
         self.diagnosis_finalized = False
         self.search_query = ""
@@ -307,10 +326,17 @@ class DiagnosticApp(ctk.CTk):
         # Make sure symptom scroll frame is visible (in case it was hidden by search)
         self.symptom_scroll_frame.pack(fill="both", expand=True, padx=20, pady=(0, 20))
         
-        # Clear existing buttons
+        # Get next symptoms
+        next_symptoms = [] if self.diagnosis_finalized else self.get_next_symptoms()
+        
+        # Cards for symptoms that are still suggested are kept and updated in place; everything
+        # else in the list (other cards, the summary, the "no further symptoms" note) goes
+        kept = {s: card for s, card in self.symptom_buttons.items() if s in next_symptoms}
+        kept_cards = set(kept.values())
         for widget in self.symptom_scroll_frame.winfo_children():
-            widget.destroy()
-        self.symptom_buttons = []
+            if widget not in kept_cards:
+                widget.destroy()
+        self.symptom_buttons = kept
         
         # Show skip button if diagnosis is not finalized
         if not self.diagnosis_finalized and self.symptom_header.action_btn:
@@ -320,16 +346,6 @@ class DiagnosticApp(ctk.CTk):
             self.show_completion_summary()
             return
         
-        # Get next symptoms
-        next_symptoms = select_next_symptoms(
-            self.candidates,
-            self.symptom_map,
-            self.asked,
-            top_n=10,
-            cluster_strength=self.cluster_strength,
-            scarcity_boosts=self.scarcity_boosts
-        )
-        
         self.current_symptoms = next_symptoms
         
         if not next_symptoms:
@@ -337,22 +353,53 @@ class DiagnosticApp(ctk.CTk):
                 self.symptom_scroll_frame,
                 text="No further symptoms available",
                 font=ctk.CTkFont(size=13),
-                text_color=COLORS["text_muted"]
+                text_color=Colors.TEXT_TERTIARY
             )
             no_symptoms_label.pack(pady=50)
             return
         
-        # Create symptom buttons
+        # Kept cards are still packed in their old order. If they lead the new list in that
+        # same order, new cards just go after them; otherwise everything is re-packed in order
+        in_place = list(kept) == next_symptoms[:len(kept)]
         for i, symptom in enumerate(next_symptoms):
-            self.create_symptom_button(symptom, i)
+            card = kept.get(symptom)
+            if card is None:
+                self.create_symptom_button(symptom, i)
+                continue
+            card.set_selected(symptom == self.selected_symptom)
+            if not in_place:
+                card.pack_forget()
+                card.pack(fill="x", padx=10, pady=6)
+        self.symptom_buttons = {s: self.symptom_buttons[s] for s in next_symptoms}
+    
+    def get_next_symptoms(self):
+        """Top 10 next-symptom suggestions, re-ranked only when the state they depend on changed.
+        The key holds the candidates dict itself (not its id), so a recycled id can't match."""
+        key = (self.candidates, frozenset(self.asked), tuple(self.cluster_strength))
+        if self._next_cache[0] != key:
+            next_symptoms = select_next_symptoms(
+                self.candidates,
+                self.lr_table,
+                self.asked,
+                top_n=10,
+                cluster_strength=self.cluster_strength,
+                scarcity_boosts=self.scarcity_boosts
+            )
+            self._next_cache = (key, next_symptoms)
+        return self._next_cache[1]
     
     def on_search_change(self, event=None):
         """Handle search input changes"""
         query = self.search_entry.get().strip().lower()
         self.search_query = query
         
+        # Restart the debounce window on every keystroke
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+            self._search_after_id = None
+        
         if query:
-            self.show_search_results()
+            self._search_after_id = self.after(self.SEARCH_DEBOUNCE_MS, self._render_search)
         else:
             # Clear search results and show normal symptom list
             if self.search_results_frame:
@@ -361,6 +408,12 @@ class DiagnosticApp(ctk.CTk):
             self.symptom_scroll_frame.pack(fill="both", expand=True, padx=20, pady=(0, 20))
             # Don't call update_symptom_panel here to avoid recursion - just continue with normal flow
     
+    def _render_search(self):
+        """Debounced tail of on_search_change - skipped if the search was cleared meanwhile"""
+        self._search_after_id = None
+        if self.search_query:
+            self.show_search_results()
+    
     def on_search_enter(self, event=None):
         """Handle Enter key in search - select first result if available"""
         query = self.search_entry.get().strip().lower()
@@ -368,8 +421,7 @@ class DiagnosticApp(ctk.CTk):
             return
         
         # Get filtered symptoms (excluding already asked ones)
-        all_symptoms = list(self.symptom_map.keys())
-        filtered = [s for s in all_symptoms if query in s.lower() and s not in self.asked]
+        filtered = [s for s, lower in self.symptom_names if query in lower and s not in self.asked]
         
         if filtered:
             # Select the first matching symptom
@@ -383,36 +435,33 @@ class DiagnosticApp(ctk.CTk):
         if not query:
             return
         
-        # Get all available symptoms
-        all_symptoms = list(self.symptom_map.keys())
-        
         # Filter symptoms that match the query and haven't been asked yet
-        filtered = [s for s in all_symptoms if query in s.lower() and s not in self.asked]
+        filtered = [(s, lower) for s, lower in self.symptom_names if query in lower and s not in self.asked]
         
         # Calculate information gain for each symptom to prioritize diagnostically valuable ones
         from inference import positive_score
         symptom_scores = []
-        for symptom in filtered:
-            did_map = self.symptom_map.get(symptom, {})
+        for symptom, lower in filtered:
+            lr_row = self.lr_table.get(symptom, {})
             gain = positive_score(
                 symptom, 
-                did_map, 
+                lr_row, 
                 self.candidates,
                 cluster_strength=self.cluster_strength,
                 scarcity_boosts=self.scarcity_boosts
             )
-            symptom_scores.append((symptom, gain))
+            symptom_scores.append((symptom, lower, gain))
         
         # Sort by information gain (highest first), then by exact match, then alphabetically
         symptom_scores.sort(key=lambda x: (
-            -x[1],  # Negative for descending order (highest gain first)
-            not x[0].lower().startswith(query),  # Exact matches first
-            x[0].lower().find(query),  # Then by position in string
-            x[0].lower()  # Finally alphabetically
+            -x[2],  # Negative for descending order (highest gain first)
+            not x[1].startswith(query),  # Exact matches first
+            x[1].find(query),  # Then by position in string
+            x[1]  # Finally alphabetically
         ))
         
         # Limit to top 20 results
-        filtered = [symptom for symptom, _ in symptom_scores[:20]]
+        filtered = [symptom for symptom, _, _ in symptom_scores[:20]]
         
         # Hide normal symptom scroll frame
         self.symptom_scroll_frame.pack_forget()
@@ -425,12 +474,12 @@ class DiagnosticApp(ctk.CTk):
         else:
             self.search_results_frame = ctk.CTkFrame(
                 self.symptom_content_frame,
-                fg_color=COLORS["bg_light"],
+                fg_color=Colors.BG_TERTIARY,
                 corner_radius=6
             )
             self.search_results_scroll = ctk.CTkScrollableFrame(
                 self.search_results_frame,
-                fg_color=COLORS["bg_light"],
+                fg_color=Colors.BG_TERTIARY,
                 corner_radius=6
             )
             self.search_results_scroll.pack(fill="both", expand=True, padx=10, pady=10)
@@ -443,7 +492,7 @@ class DiagnosticApp(ctk.CTk):
                 self.search_results_scroll,
                 text=f"No symptoms found matching '{query}'",
                 font=ctk.CTkFont(size=13),
-                text_color=COLORS["text_muted"]
+                text_color=Colors.TEXT_TERTIARY
             )
             no_results_label.pack(pady=50)
             return
@@ -453,7 +502,7 @@ class DiagnosticApp(ctk.CTk):
             self.search_results_scroll,
             text=f"Found {len(filtered)} symptom{'s' if len(filtered) != 1 else ''}",
             font=ctk.CTkFont(size=11),
-            text_color=COLORS["text_secondary"]
+            text_color=Colors.TEXT_SECONDARY
         )
         count_label.pack(pady=(0, 10))
         
@@ -491,7 +540,7 @@ class DiagnosticApp(ctk.CTk):
         )
         symptom_card.pack(fill="x", padx=10, pady=6)
         
-        self.symptom_buttons.append(symptom_card)
+        self.symptom_buttons[symptom] = symptom_card
     
     def show_completion_summary(self):
         """Show detailed completion summary in symptom panel"""
@@ -499,18 +548,18 @@ class DiagnosticApp(ctk.CTk):
         if self.symptom_header.action_btn:
             self.symptom_header.action_btn.pack_forget()
         
-        # Calculate final stats
-        sorted_candidates = sorted(
-            self.candidates.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )
+        # Calculate final stats (only the top 3 are ever shown)
+        sorted_candidates = heapq.nlargest(3, self.candidates.items(), key=lambda x: x[1])
         top_id, top_prob = sorted_candidates[0] if sorted_candidates else (None, 0.0)
-        top_disease_name = self.diseases.get(top_id, {}).get("name", "Unknown") if top_id else "No Diagnosis"
+        if top_id:
+            top_disease = self.diseases.get(top_id)
+            top_disease_name = top_disease["name"] if top_disease else "Unknown"
+        else:
+            top_disease_name = "No Diagnosis"
         confidence, gap = calculate_confidence(self.candidates, self.diseases)
-        req_hits_top = dynamic_required_hits(self.symptom_map, top_id) if top_id else 0
+        req_hits_top = self.req_hits_by_disease.get(top_id, 0) if top_id else 0
         hits_top = self.evidence_hits_by_disease.get(top_id, 0) if top_id else 0
-        remaining = [d for d, p in sorted_candidates if p > 0.01]
+        num_remaining = sum(1 for p in self.candidates.values() if p > 0.01)
         
         # Stats data with more detail
         stats_data = [
@@ -519,16 +568,16 @@ class DiagnosticApp(ctk.CTk):
             ("Final Confidence", f"{confidence:.1%}"),
             ("Confidence Gap", f"{gap:.4f}"),
             ("Top Disease Hits", f"{hits_top}/{req_hits_top}"),
-            ("Remaining Candidates", f"{len(remaining)}"),
+            ("Remaining Candidates", f"{num_remaining}"),
             ("Final Top Probability", f"{top_prob:.3f}"),
         ]
         
         # Top 3 diseases for summary
         top_diseases = []
-        for i, (disease_id, probability) in enumerate(sorted_candidates[:3]):
+        for i, (disease_id, probability) in enumerate(sorted_candidates):
             disease_info = self.diseases[disease_id]
             hits = self.evidence_hits_by_disease.get(disease_id, 0)
-            req_hits = dynamic_required_hits(self.symptom_map, disease_id)
+            req_hits = self.req_hits_by_disease[disease_id]
             top_diseases.append((disease_id, disease_info['name'], probability, hits, req_hits))
         
         # Create completion summary using component
@@ -548,9 +597,7 @@ class DiagnosticApp(ctk.CTk):
             return
         
         # Mark all current symptoms as asked
-        for symptom in self.current_symptoms:
-            if symptom not in self.asked:
-                self.asked.add(symptom)
+        self.asked.update(self.current_symptoms)
         
         self.selected_symptom = None
         self.update_ui()
@@ -594,21 +641,17 @@ class DiagnosticApp(ctk.CTk):
         self.symptom_path.append(symptom)  # Track order
         
         # Update cluster strength
-        cluster = categorize_symptom(symptom)
+        cluster = cluster_index(symptom)
         from inference import CLUSTER_BOOST_PER_HIT, CLUSTER_BOOST_MAX
         self.cluster_strength[cluster] = min(
             CLUSTER_BOOST_MAX,
-            self.cluster_strength.get(cluster, 0.0) + CLUSTER_BOOST_PER_HIT
+            self.cluster_strength[cluster] + CLUSTER_BOOST_PER_HIT
         )
         
         # Track evidence hits
-        did_map = self.symptom_map.get(symptom, {})
-        has_any_lr = False
-        for d_id, vals in did_map.items():
-            if vals.get('lr_pos') is not None:
-                self.evidence_hits_by_disease[d_id] += 1
-                has_any_lr = True
-        if has_any_lr:
+        lr_row = self.lr_table.get(symptom, {})
+        self.evidence_hits_by_disease.update(lr_row.keys())
+        if lr_row:
             self.answered_with_lr += 1
         
         # Update posteriors
@@ -616,7 +659,7 @@ class DiagnosticApp(ctk.CTk):
         self.candidates = update_posteriors_positive(
             self.candidates,
             symptom,
-            self.symptom_map,
+            self.lr_table,
             self.cluster_strength,
             self.scarcity_boosts
         )
@@ -633,12 +676,10 @@ class DiagnosticApp(ctk.CTk):
     
     def update_diagnosis_panel(self):
         """Update diagnosis results panel"""
-        # Clear existing cards
-        for widget in self.diagnoses_scroll_frame.winfo_children():
-            widget.destroy()
-        self.diagnosis_cards = []
-        
         if not self.candidates:
+            for widget in self.diagnoses_scroll_frame.winfo_children():
+                widget.destroy()
+            self.diagnosis_cards = []
             return
         
         # Calculate confidence
@@ -648,20 +689,32 @@ class DiagnosticApp(ctk.CTk):
         self.confidence_indicator.update_confidence(confidence)
         
         # Get top diagnoses
-        sorted_candidates = sorted(
-            self.candidates.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )
+        sorted_candidates = heapq.nlargest(10, self.candidates.items(), key=lambda x: x[1])
         
         # Show all diagnoses with probability > 0.001, or top 10, whichever is less
-        top_diseases = [(d, p) for d, p in sorted_candidates if p > 0.001][:10]
+        top_diseases = [(d, p) for d, p in sorted_candidates if p > 0.001]
         
+        # Cards belong to rank slots: the ones already on screen are updated in place, and
+        # only the difference in count is built or destroyed
         for i, (disease_id, probability) in enumerate(top_diseases):
             disease_info = self.diseases[disease_id]
             hits = self.evidence_hits_by_disease.get(disease_id, 0)
-            req_hits = dynamic_required_hits(self.symptom_map, disease_id)
-            self.create_diagnosis_card(disease_info, probability, i + 1, gap if i == 0 else None, hits, req_hits)
+            req_hits = self.req_hits_by_disease[disease_id]
+            if i < len(self.diagnosis_cards):
+                self.diagnosis_cards[i].update_card(
+                    disease_info["name"],
+                    probability,
+                    severity=disease_info.get('triage_severity', None),
+                    hits=hits,
+                    req_hits=req_hits,
+                    description=disease_info.get("description", None)
+                )
+            else:
+                self.create_diagnosis_card(disease_info, probability, i + 1, gap if i == 0 else None, hits, req_hits)
+        
+        for card in self.diagnosis_cards[len(top_diseases):]:
+            card.destroy()
+        del self.diagnosis_cards[len(top_diseases):]
     
     def create_diagnosis_card(self, disease_info, probability, rank, gap=None, hits=0, req_hits=0):
         """Create a card for a diagnosis using DiagnosisCard component"""
@@ -684,15 +737,15 @@ class DiagnosticApp(ctk.CTk):
         if self.diagnosis_finalized:
             return
         
-        sorted_c = sorted(self.candidates.items(), key=lambda x: x[1], reverse=True)
-        if not sorted_c:
+        if not self.candidates:
             return
         
-        top_id, top_prob = sorted_c[0]
-        remaining = [d for d, p in sorted_c if p > 0.01]
+        top_id = max(self.candidates, key=self.candidates.get)
+        top_prob = self.candidates[top_id]
+        num_remaining = sum(1 for p in self.candidates.values() if p > 0.01)
         
         confidence, gap = calculate_confidence(self.candidates, self.diseases)
-        req_hits_top = dynamic_required_hits(self.symptom_map, top_id)
+        req_hits_top = self.req_hits_by_disease[top_id]
         hits_top = self.evidence_hits_by_disease.get(top_id, 0)
         
         # Update status using component method
@@ -701,14 +754,12 @@ class DiagnosticApp(ctk.CTk):
         self.symptom_header.update_status(status_text)
         
         # Check convergence criteria
-        top_posterior = max(self.candidates.values()) if self.candidates else 0.0
-        
-        if hits_top >= req_hits_top and top_posterior >= EARLY_FINALIZE_TOPP:
+        if hits_top >= req_hits_top and top_prob >= EARLY_FINALIZE_TOPP:
             self.diagnosis_finalized = True
             self.update_ui()
             return
         
-        if (confidence >= SUCCESS_CONFIDENCE and self.answered_with_lr >= MIN_EVIDENCE_ANSWERS) or len(remaining) <= 2:
+        if (confidence >= SUCCESS_CONFIDENCE and self.answered_with_lr >= MIN_EVIDENCE_ANSWERS) or num_remaining <= 2:
             self.diagnosis_finalized = True
             self.update_ui()
             return
@@ -718,16 +769,8 @@ class DiagnosticApp(ctk.CTk):
             self.update_ui()
             return
         
-        # Check if no more symptoms
-        next_symptoms = select_next_symptoms(
-            self.candidates,
-            self.symptom_map,
-            self.asked,
-            top_n=1,
-            cluster_strength=self.cluster_strength,
-            scarcity_boosts=self.scarcity_boosts
-        )
-        if not next_symptoms:
+        # Check if no more symptoms (any suggestion at all - same filter as the top 10)
+        if not self.get_next_symptoms():
             self.diagnosis_finalized = True
             self.update_ui()
     
@@ -736,13 +779,13 @@ class DiagnosticApp(ctk.CTk):
         dialog = ctk.CTkToplevel(self)
         dialog.title("Error")
         dialog.geometry("400x150")
-        dialog.configure(fg_color=COLORS["bg_medium"])
+        dialog.configure(fg_color=Colors.BG_SECONDARY)
         
         label = ctk.CTkLabel(
             dialog,
             text=message,
             font=ctk.CTkFont(size=14),
-            text_color=COLORS["danger"],
+            text_color=Colors.DANGER,
             wraplength=350
         )
         label.pack(pady=30)
@@ -751,7 +794,7 @@ class DiagnosticApp(ctk.CTk):
             dialog,
             text="OK",
             command=dialog.destroy,
-            fg_color=COLORS["accent"]
+            fg_color=Colors.ACCENT_PRIMARY
         )
         btn.pack(pady=10)
 
@@ -2,10 +2,12 @@
 import sqlite3
 from math import log2
 import math
+import heapq
 import sys
 import os
-from collections import defaultdict
-import argparse
+from collections import Counter, defaultdict
+from functools import lru_cache
+from pathlib import Path
 
 # disambiguate and add more features.
 # choose more realistic numbers.
@@ -462,8 +464,12 @@ LAY_EXPLANATIONS = {
 }
 
 CLUSTERS = ["respiratory", "ent", "gi", "gu", "skin", "eye", "general"]
+# cluster_strength is a list aligned with CLUSTERS; this maps a cluster name to its slot
+CLUSTER_INDEX = {c: i for i, c in enumerate(CLUSTERS)}
 
 
+# Pure function of the symptom name; called for every scored and every answered symptom
+@lru_cache(maxsize=None)
 def categorize_symptom(symptom: str) -> str:
     s = symptom.lower()
     if any(k in s for k in ["wheez", "tachypnea", "retraction", "hypox", "cough", "stridor", "barking", "pleuritic", "crackles", "dyspnea", "chest"]):
@@ -481,6 +487,12 @@ def categorize_symptom(symptom: str) -> str:
     return "general"
 
 
+@lru_cache(maxsize=None)
+def cluster_index(symptom: str) -> int:
+    return CLUSTER_INDEX[categorize_symptom(symptom)]
+
+
+@lru_cache(maxsize=None)
 def explain_symptom(symptom: str) -> str:
     if symptom in LAY_EXPLANATIONS:
         return LAY_EXPLANATIONS[symptom]
@@ -490,21 +502,40 @@ def explain_symptom(symptom: str) -> str:
     return f"Plain terms: {symptom.lower()}."
 
 
-def count_evidence_symptoms_for_disease(symptom_map: dict, disease_id: int) -> int:
-    count = 0
+def build_evidence_index(symptom_map: dict) -> dict[int, list[str]]:
+    # Inverted index: disease id -> symptoms carrying a positive LR for it (one pass over symptom_map)
+    index = defaultdict(list)
+    for sym, did_map in symptom_map.items():
+        for did, vals in did_map.items():
+            if vals.get("lr_pos") is not None:
+                index[did].append(sym)
+    return dict(index)
+
+
+def build_lr_table(symptom_map: dict) -> dict[str, dict[int, float]]:
+    # Flattened LR+ lookup: symptom -> {disease id: lr_pos}, keeping only entries with an LR+
+    table = {}
     for sym, did_map in symptom_map.items():
-        if disease_id in did_map and did_map[disease_id].get("lr_pos") is not None:
-            count += 1
-    return count
+        row = {did: vals["lr_pos"] for did, vals in did_map.items() if vals.get("lr_pos") is not None}
+        if row:
+            table[sym] = row
+    return table
 
 
-def dynamic_required_hits(symptom_map: dict, disease_id: int) -> int:
-    n = count_evidence_symptoms_for_disease(symptom_map, disease_id)
+def dynamic_required_hits(evidence_index: dict[int, list[str]], disease_id: int) -> int:
+    n = len(evidence_index.get(disease_id, ()))
     # Require roughly 40% of available positive-evidence symptoms, clamped between 2 and 5
     required = math.ceil(0.4 * n)
     return max(2, min(5, required))
 
 
+def compute_required_hits(evidence_index: dict[int, list[str]], disease_ids: list[int]) -> dict[int, int]:
+    # Required hits depend only on the (static) evidence, so resolve them once per disease up front
+    return {d: dynamic_required_hits(evidence_index, d) for d in disease_ids}
+
+
+# Parsed once per database path; callers share the returned dicts and must not mutate them.
+@lru_cache(maxsize=1)
 def load_data(db_path="pediatric.db"):
     # Handle PyInstaller executable case
     if getattr(sys, 'frozen', False):
@@ -529,7 +560,9 @@ def load_data(db_path="pediatric.db"):
             # If not found, use original path and let sqlite3 handle the error
             pass
     
-    conn = sqlite3.connect(db_path)
+    # Inference never writes, so open read-only: no journal/locking overhead, and a
+    # missing file is reported instead of silently created as an empty database
+    conn = sqlite3.connect(f"{Path(db_path).absolute().as_uri()}?mode=ro", uri=True)
     cur = conn.cursor()
 
     cur.execute(
@@ -557,7 +590,7 @@ def load_data(db_path="pediatric.db"):
         SELECT disease_id, prevalence FROM disease_priors
         """
     )
-    priors = {row[0]: float(row[1]) for row in cur.fetchall() if row[1] is not None}
+    priors = {row[0]: float(row[1]) for row in cur if row[1] is not None}
     if priors:
         total_prior = sum(priors.values()) or 1.0
         priors = {d: p / total_prior for d, p in priors.items() if d in diseases}
@@ -573,7 +606,8 @@ def load_data(db_path="pediatric.db"):
         """
     )
     symptom_map = {}
-    for did, symptom, lr_pos, lr_neg in cur.fetchall():
+    # Stream evidence rows off the cursor rather than materialising them all with fetchall()
+    for did, symptom, lr_pos, lr_neg in cur:
         if did not in diseases:
             continue
         info = symptom_map.setdefault(symptom, {})
@@ -592,19 +626,15 @@ def load_data(db_path="pediatric.db"):
     return diseases, priors, symptom_map
 
 
-def compute_scarcity_boosts(symptom_map: dict, disease_ids: list[int]) -> dict[int, float]:
-    counts = {d: count_evidence_symptoms_for_disease(symptom_map, d) for d in disease_ids}
-    nonzero = [max(1, c) for c in counts.values()] or [1]
+def compute_scarcity_boosts(evidence_index: dict[int, list[str]], disease_ids: list[int]) -> dict[int, float]:
+    counts = [max(1, len(evidence_index.get(d, ()))) for d in disease_ids]
     # Use median as reference
-    sorted_counts = sorted(nonzero)
-    m = sorted_counts[len(sorted_counts)//2]
-    boosts = {}
-    for d, c in counts.items():
-        c = max(1, c)
-        raw = (m / c) - 1.0  # >0 if fewer than median
-        boost = max(0.0, min(SCARCITY_BOOST_MAX, SCARCITY_WEIGHT * raw))
-        boosts[d] = boost
-    return boosts
+    m = sorted(counts)[len(counts)//2] if counts else 1
+    # (m / c) - 1 is >0 if fewer than median; clamp the weighted value to [0, SCARCITY_BOOST_MAX]
+    return {
+        d: max(0.0, min(SCARCITY_BOOST_MAX, SCARCITY_WEIGHT * ((m / c) - 1.0)))
+        for d, c in zip(disease_ids, counts)
+    }
 
 
 def compute_entropy(p_yes):
@@ -613,50 +643,51 @@ def compute_entropy(p_yes):
     return -p_yes * log2(p_yes) - (1 - p_yes) * log2(1 - p_yes)
 
 
-def positive_score(symptom, did_map, candidates, min_lr_pos: float = 1.0, cluster_strength=None, scarcity_boosts=None):
+def positive_score(symptom, lr_row, candidates, min_lr_pos: float = 1.0, cluster_strength=None, scarcity_boosts=None):
     score = 0.0
     has_pos = False
+    scarcity_boosts = scarcity_boosts or {}
     for d, post in candidates.items():
-        lrp = did_map.get(d, {}).get("lr_pos")
+        lrp = lr_row.get(d)
         if lrp is not None and lrp >= min_lr_pos:
             has_pos = True
-            scarcity = (scarcity_boosts or {}).get(d, 0.0)
+            scarcity = scarcity_boosts.get(d, 0.0)
             mult = 1.0 + scarcity
             score += post * max(0.0, math.log(lrp)) * mult
     if not has_pos:
         return 0.0
     if cluster_strength is not None:
-        cluster = categorize_symptom(symptom)
-        score *= (1.0 + 0.5 * min(CLUSTER_BOOST_MAX, cluster_strength.get(cluster, 0.0)))
+        score *= (1.0 + 0.5 * min(CLUSTER_BOOST_MAX, cluster_strength[cluster_index(symptom)]))
     return score
 
 
-def select_next_symptoms(candidates, symptom_map, asked, top_n=5, cluster_strength=None, scarcity_boosts=None):
+def select_next_symptoms(candidates, lr_table, asked, top_n=5, cluster_strength=None, scarcity_boosts=None):
     infos = []
-    for symptom, did_map in symptom_map.items():
+    for symptom, lr_row in lr_table.items():
         if symptom in asked:
             continue
-        gain = positive_score(symptom, did_map, candidates, cluster_strength=cluster_strength, scarcity_boosts=scarcity_boosts)
+        gain = positive_score(symptom, lr_row, candidates, cluster_strength=cluster_strength, scarcity_boosts=scarcity_boosts)
         if gain > 0:
             infos.append((symptom, gain))
     infos.sort(key=lambda x: x[1], reverse=True)
     return [symptom for symptom, _ in infos[:top_n]]
 
 
-def update_posteriors_positive(candidates, symptom, symptom_map, cluster_strength, scarcity_boosts):
+def update_posteriors_positive(candidates, symptom, lr_table, cluster_strength, scarcity_boosts):
     updated = {}
-    cluster = categorize_symptom(symptom)
-    cluster_boost = min(CLUSTER_BOOST_MAX, cluster_strength.get(cluster, 0.0))
+    cluster_boost = min(CLUSTER_BOOST_MAX, cluster_strength[cluster_index(symptom)])
+    # Loop-invariant lookups hoisted out of the per-disease pass
+    lr_row = lr_table.get(symptom, {})
+    scarcity_boosts = scarcity_boosts or {}
     for d, post in candidates.items():
-        did_map = symptom_map.get(symptom, {})
-        lr_pos = did_map.get(d, {}).get("lr_pos")
+        lr_pos = lr_row.get(d)
         # coverage penalty if missing LR
         if lr_pos is None:
             post *= COVERAGE_PENALTY
             lr = 1.0
         else:
-            scarcity = scarcity_boosts.get(d, 0.0) if scarcity_boosts else 0.0
-            stage = STAGE_BOOST_MAX * candidates.get(d, 0.0)
+            scarcity = scarcity_boosts.get(d, 0.0)
+            stage = STAGE_BOOST_MAX * post
             alpha_extra = min(ALPHA_CAP - 1.0, cluster_boost + scarcity + stage)
             lr = max(1e-9, lr_pos) ** (1.0 + alpha_extra)
         post = max(min(post, 1 - 1e-12), 1e-12)
@@ -669,13 +700,14 @@ def update_posteriors_positive(candidates, symptom, symptom_map, cluster_strengt
 
 
 def calculate_confidence(candidates, diseases):
-    sorted_c = sorted(candidates.items(), key=lambda x: x[1], reverse=True)
-    if not sorted_c:
+    # Only the two leaders matter; nlargest avoids sorting every candidate
+    top_two = heapq.nlargest(2, candidates.items(), key=lambda x: x[1])
+    if not top_two:
         return 0.0, 0.0
-    top_prob = sorted_c[0][1]
-    second_prob = sorted_c[1][1] if len(sorted_c) > 1 else 0.0
+    top_prob = top_two[0][1]
+    second_prob = top_two[1][1] if len(top_two) > 1 else 0.0
     confidence = top_prob * (1 + (top_prob - second_prob))
-    top_disease = diseases[sorted_c[0][0]]
+    top_disease = diseases[top_two[0][0]]
     severity_factor = top_disease.get("triage_severity", 1.0)
     return min(confidence * severity_factor, 1.0), top_prob - second_prob
 
@@ -683,19 +715,23 @@ def calculate_confidence(candidates, diseases):
 def preview_recommendations(diseases, priors, symptom_map, top_n=10):
     candidates = dict(priors)
     asked = set()
-    cluster_strength = {c: 0.0 for c in CLUSTERS}
-    scarcity_boosts = compute_scarcity_boosts(symptom_map, list(diseases.keys()))
-    recs = select_next_symptoms(candidates, symptom_map, asked, top_n=top_n, cluster_strength=cluster_strength, scarcity_boosts=scarcity_boosts)
+    cluster_strength = [0.0] * len(CLUSTERS)
+    evidence_index = build_evidence_index(symptom_map)
+    scarcity_boosts = compute_scarcity_boosts(evidence_index, list(diseases.keys()))
+    lr_table = build_lr_table(symptom_map)
+    recs = select_next_symptoms(candidates, lr_table, asked, top_n=top_n, cluster_strength=cluster_strength, scarcity_boosts=scarcity_boosts)
     print("Recommended next symptoms (with plain-language help):")
     for i, sym in enumerate(recs, 1):
-        did_map = symptom_map.get(sym, {})
-        num_with_lr = sum(1 for v in did_map.values() if (v.get('lr_pos') is not None))
+        num_with_lr = len(lr_table.get(sym, {}))
         print(f"{i}. {sym}")
         print(f"   What it means: {explain_symptom(sym)}")
         print(f"   Positive LR coverage: {num_with_lr} diseases")
 
 
 def main():
+    # Only the CLI needs argparse; the GUI imports this module for the model alone
+    import argparse
+
     parser = argparse.ArgumentParser()
     parser.add_argument("--preview", type=int, default=0, help="Show top-N recommended symptoms and exit")
     parser.add_argument("--db", type=str, default="pediatric.db", help="Database file path")
@@ -719,18 +755,21 @@ def main():
 
     asked = set()
     answered_with_lr = 0
-    evidence_hits_by_disease = defaultdict(int)
-    cluster_strength = {c: 0.0 for c in CLUSTERS}
-    scarcity_boosts = compute_scarcity_boosts(symptom_map, list(diseases.keys()))
+    evidence_hits_by_disease = Counter()
+    cluster_strength = [0.0] * len(CLUSTERS)
+    evidence_index = build_evidence_index(symptom_map)
+    scarcity_boosts = compute_scarcity_boosts(evidence_index, list(diseases.keys()))
+    lr_table = build_lr_table(symptom_map)
+    req_hits_by_disease = compute_required_hits(evidence_index, list(diseases.keys()))
     consecutive_low_gain = 0
 
     while True:
-        sorted_c = sorted(candidates.items(), key=lambda x: x[1], reverse=True)
-        top_id, top_prob = sorted_c[0]
-        remaining = [d for d, p in sorted_c if p > 0.01]
+        top_c = heapq.nlargest(3, candidates.items(), key=lambda x: x[1])
+        top_id, top_prob = top_c[0]
+        num_remaining = sum(1 for p in candidates.values() if p > 0.01)
 
         print("\nCurrent top diagnoses:")
-        for did, prob in sorted_c[:3]:
+        for did, prob in top_c:
             disease_info = diseases[did]
             print(f"{disease_info['name']} (P={prob:.3f})")
             print(f"  Triage severity: {disease_info['triage_severity']}")
@@ -738,28 +777,26 @@ def main():
                 print(f"  Description: {disease_info['description']}")
 
         confidence, gap = calculate_confidence(candidates, diseases)
-        req_hits_top = dynamic_required_hits(symptom_map, top_id)
+        req_hits_top = req_hits_by_disease[top_id]
         hits_top = evidence_hits_by_disease.get(top_id, 0)
         print(f"Current confidence: {confidence:.2f} (gap={gap:.2f}), answered with evidence: {answered_with_lr}, top disease hits {hits_top}/{req_hits_top}")
 
-        top_posterior = max(candidates.values()) if candidates else 0.0
-        if hits_top >= req_hits_top and top_posterior >= EARLY_FINALIZE_TOPP:
+        if hits_top >= req_hits_top and top_prob >= EARLY_FINALIZE_TOPP:
             print("\nEarly finalize criteria met (per-disease).")
             break
 
-        if (confidence >= SUCCESS_CONFIDENCE and answered_with_lr >= MIN_EVIDENCE_ANSWERS) or len(remaining) <= 2:
+        if (confidence >= SUCCESS_CONFIDENCE and answered_with_lr >= MIN_EVIDENCE_ANSWERS) or num_remaining <= 2:
             print("\nStopping criteria met.")
             break
 
-        next_syms = select_next_symptoms(candidates, symptom_map, asked, top_n=15, cluster_strength=cluster_strength, scarcity_boosts=scarcity_boosts)
+        next_syms = select_next_symptoms(candidates, lr_table, asked, top_n=15, cluster_strength=cluster_strength, scarcity_boosts=scarcity_boosts)
         if not next_syms:
             print("\nNo further high-value symptoms remain. Finalizing.")
             break
 
         print("\nNext symptom options (choose one that IS present):")
         for i, sym in enumerate(next_syms, 1):
-            did_map = symptom_map.get(sym, {})
-            num_with_lr = sum(1 for v in did_map.values() if (v.get('lr_pos') is not None))
+            num_with_lr = len(lr_table.get(sym, {}))
             print(f"{i}. {sym}")
             print(f"   What it means: {explain_symptom(sym)}")
             print(f"   Positive LR coverage: {num_with_lr} diseases")
@@ -769,13 +806,11 @@ def main():
             break
         if choice.lower() == 's':
             # Skip: just mark symptoms as asked and show new options (don't count as low gain)
-            for sym in next_syms:
-                asked.add(sym)
+            asked.update(next_syms)
             continue
         if choice == '0' or choice.lower() in ('none', 'n'):
             # Mark all proposed as asked and continue (counts as low gain since no symptom selected)
-            for sym in next_syms:
-                asked.add(sym)
+            asked.update(next_syms)
             consecutive_low_gain += 1
             if consecutive_low_gain >= 2:
                 print("\nInsufficient progress. Finalizing.")
@@ -792,20 +827,18 @@ def main():
         symptom = next_syms[idx]
         asked.add(symptom)
 
-        cl = categorize_symptom(symptom)
-        cluster_strength[cl] = min(CLUSTER_BOOST_MAX, cluster_strength.get(cl, 0.0) + CLUSTER_BOOST_PER_HIT)
+        cl = cluster_index(symptom)
+        cluster_strength[cl] = min(CLUSTER_BOOST_MAX, cluster_strength[cl] + CLUSTER_BOOST_PER_HIT)
 
-        did_map = symptom_map.get(symptom, {})
-        has_any_lr = False
-        for d_id, vals in did_map.items():
-            if vals.get('lr_pos') is not None:
-                evidence_hits_by_disease[d_id] += 1
-                has_any_lr = True
-        if has_any_lr:
+        # Every disease with an LR+ for this symptom gains one evidence hit
+        lr_row = lr_table.get(symptom, {})
+        evidence_hits_by_disease.update(lr_row.keys())
+        if lr_row:
             answered_with_lr += 1
 
-        prev_top = max(candidates.values()) if candidates else 0.0
-        candidates = update_posteriors_positive(candidates, symptom, symptom_map, cluster_strength, scarcity_boosts)
+        # Candidates are unchanged since the top of the loop, so top_prob is still current
+        prev_top = top_prob
+        candidates = update_posteriors_positive(candidates, symptom, lr_table, cluster_strength, scarcity_boosts)
         new_top = max(candidates.values()) if candidates else 0.0
         if new_top - prev_top < 0.05:
             consecutive_low_gain += 1